@@ -7,20 +7,54 @@ Note: Model and Memory are read from statusline.py's cache file
 
 from __future__ import annotations
 
+import atexit
 import fcntl
+import fnmatch
 import glob
+import http.client
 import json
 import os
+import queue
+import socket
 import subprocess
 import sys
+import termios
+import threading
 import time
-import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
-from urllib.error import URLError
-from urllib.request import Request, urlopen
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+# ============================================================================
+# JSON Helpers
+# ============================================================================
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def json_load_file(path: str) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, "rb") as f:
+        return json_loads(f.read())
 
 # ============================================================================
 # Configuration Loading
@@ -33,9 +67,8 @@ def load_config() -> None:
         return
 
     try:
-        with open(config_file) as f:
-            config = json.load(f)
-    except (json.JSONDecodeError, IOError):
+        config = json_load_file(str(config_file))
+    except (ValueError, IOError):
         return
 
     # Map config keys to environment variables
@@ -43,6 +76,7 @@ def load_config() -> None:
         "debug": ("DEBUG", lambda v: "1" if v else "0"),
         "cache_path": ("VIBEMON_CACHE_PATH", str),
         "auto_launch": ("VIBEMON_AUTO_LAUNCH", lambda v: "1" if v else "0"),
+        "daemon": ("VIBEMON_DAEMON", lambda v: "1" if v else "0"),
         "http_urls": ("VIBEMON_HTTP_URLS", lambda v: ",".join(v) if isinstance(v, list) else str(v)),
         "serial_port": ("VIBEMON_SERIAL_PORT", str),
         "vibemon_url": ("VIBEMON_URL", str),
@@ -69,19 +103,37 @@ ERR_NO_TARGET = '{"error":"No monitor target available. Set VIBEMON_HTTP_URLS or
 ERR_NO_ESP32 = '{"error":"No ESP32 target available. Set VIBEMON_HTTP_URLS (with ESP32 URL) or VIBEMON_SERIAL_PORT"}'
 ERR_INVALID_MODE = '{"error":"Invalid mode: %s. Valid modes: first-project, on-thinking"}'
 
+# Success responses used when the target returns no body (pre-encoded)
+OK_LOCKED_PREFIX = b'{"success":true,"locked":"'
+OK_UNLOCKED = b'{"success":true,"locked":null}\n'
+OK_LOCK_MODE_PREFIX = b'{"success":true,"lockMode":"'
+OK_REBOOTING = b'{"success":true,"rebooting":true}\n'
+OK_STRING_SUFFIX = b'"}\n'
+
 VALID_LOCK_MODES = frozenset(["first-project", "on-thinking"])
 
 # Serial configuration
 SERIAL_DEBOUNCE_MS = 100
 SERIAL_LOCK_MAX_RETRIES = 10
 SERIAL_LOCK_RETRY_INTERVAL = 0.05
+SERIAL_LOCK_MIN_RETRY_INTERVAL = 0.002
 SERIAL_BAUD_RATE = "115200"
 
 # HTTP configuration
 HTTP_TIMEOUT_SECONDS = 5
 
+# Worker threads shared by all send_to_all calls (reused across daemon events)
+MAX_SEND_WORKERS = 8
+
 # Desktop launch configuration
 DESKTOP_LAUNCH_WAIT_SECONDS = 3
+DESKTOP_PROBE_TIMEOUT_SECONDS = 0.2
+
+# Daemon configuration
+DAEMON_SOCKET_PATH = os.path.expanduser("~/.vibemon/hook.sock")
+DAEMON_LOCK_PATH = os.path.expanduser("~/.vibemon/hook.lock")
+DAEMON_CONNECT_TIMEOUT_SECONDS = 0.5
+DAEMON_IDLE_TIMEOUT_SECONDS = 600
 
 # Character configuration
 CHARACTER = "clawd"
@@ -92,9 +144,14 @@ class Config:
     """Immutable configuration container."""
 
     http_urls: tuple[str, ...]
+    is_localhost: tuple[bool, ...]  # parallel to http_urls
+    desktop_url: str | None  # first localhost URL (Desktop App)
+    command_urls: tuple[str, ...]  # http_urls with localhost (Desktop App) first
+    remote_urls: tuple[str, ...]  # http_urls without localhost
     serial_port: str | None
     cache_path: str
     auto_launch: bool
+    daemon: bool
     vibemon_url: str | None
     vibemon_token: str | None
 
@@ -110,17 +167,32 @@ def parse_http_urls(urls_str: str | None) -> tuple[str, ...]:
     return tuple(url.strip() for url in urls_str.split(",") if url.strip())
 
 
+def is_localhost_url(url: str) -> bool:
+    """Check if URL is localhost (Desktop App)."""
+    return "127.0.0.1" in url or "localhost" in url
+
+
 def get_config() -> Config:
     """Get configuration from environment variables (cached)."""
     global _config
     if _config is None:
+        http_urls = parse_http_urls(os.environ.get("VIBEMON_HTTP_URLS"))
+        is_localhost = tuple(is_localhost_url(url) for url in http_urls)
+        local_urls = tuple(url for url, local in zip(http_urls, is_localhost) if local)
+        remote_urls = tuple(url for url, local in zip(http_urls, is_localhost) if not local)
         _config = Config(
-            http_urls=parse_http_urls(os.environ.get("VIBEMON_HTTP_URLS")),
+            http_urls=http_urls,
+            is_localhost=is_localhost,
+            desktop_url=local_urls[0] if local_urls else None,
+            # The local app answers fastest, remote URLs keep their order
+            command_urls=local_urls + remote_urls,
+            remote_urls=remote_urls,
             serial_port=os.environ.get("VIBEMON_SERIAL_PORT"),
             cache_path=os.path.expanduser(
                 os.environ.get("VIBEMON_CACHE_PATH", "~/.vibemon/cache/statusline.json")
             ),
             auto_launch=os.environ.get("VIBEMON_AUTO_LAUNCH", "0") == "1",
+            daemon=os.environ.get("VIBEMON_DAEMON", "0") == "1",
             vibemon_url=os.environ.get("VIBEMON_URL"),
             vibemon_token=os.environ.get("VIBEMON_TOKEN"),
         )
@@ -137,15 +209,52 @@ def debug_log(msg: str) -> None:
         print(f"[DEBUG] {msg}", file=sys.stderr)
 
 
+def _match_serial_ports(port_pattern: str) -> list[str]:
+    """List paths matching a serial port pattern, sorted.
+
+    Patterns with wildcards only in the file name (e.g. /dev/cu.usbmodem*)
+    are matched with a single scandir pass instead of glob.
+    """
+    dirname, basename = os.path.split(port_pattern)
+    if not dirname or any(c in dirname for c in "*?["):
+        return sorted(glob.glob(port_pattern))
+
+    # Match glob semantics: "*" does not match hidden entries
+    include_hidden = basename.startswith(".")
+    try:
+        with os.scandir(dirname) as it:
+            names = [
+                entry.name
+                for entry in it
+                if (include_hidden or not entry.name.startswith("."))
+                and fnmatch.fnmatchcase(entry.name, basename)
+            ]
+    except OSError:
+        return []
+    return [os.path.join(dirname, name) for name in sorted(names)]
+
+
+# Wildcard patterns resolved to a device (misses are never cached)
+_resolved_ports: dict[str, str] = {}
+
+
 def resolve_serial_port(port_pattern: str | None) -> str | None:
-    """Resolve serial port pattern with wildcard support."""
+    """Resolve serial port pattern with wildcard support.
+
+    A match is kept until the device goes away (see _forget_serial_port);
+    a miss is not, so a long-lived daemon finds a device plugged in later.
+    """
     if not port_pattern:
         return None
 
     if "*" in port_pattern:
-        matches = sorted(glob.glob(port_pattern))
+        port = _resolved_ports.get(port_pattern)
+        if port:
+            return port
+        matches = _match_serial_ports(port_pattern)
         if matches:
             debug_log(f"Found serial ports: {matches}, using: {matches[0]}")
+            _resolved_ports[port_pattern] = matches[0]
             return matches[0]
         debug_log(f"No serial port found matching: {port_pattern}")
         return None
@@ -153,19 +262,19 @@ def resolve_serial_port(port_pattern: str | None) -> str | None:
     return port_pattern
 
 
-def read_input() -> str:
-    """Read input from stdin."""
+def read_input() -> bytes:
+    """Read raw input bytes from stdin (parsed without decoding to str)."""
     try:
-        return sys.stdin.read()
+        return sys.stdin.buffer.read()
     except Exception:
-        return ""
+        return b""
 
 
-def parse_json(data: str) -> dict[str, Any]:
-    """Parse JSON string to dictionary."""
+def parse_json(data: str | bytes) -> dict[str, Any]:
+    """Parse JSON text or UTF-8 bytes to dictionary."""
     try:
-        return json.loads(data)
-    except (json.JSONDecodeError, TypeError):
+        return json_loads(data)
+    except (ValueError, TypeError):
         return {}
 
 # ============================================================================
@@ -182,6 +291,9 @@ EVENT_STATE_MAP: dict[str, str] = {
     "Stop": "done",
 }
 
+# States whose display includes model and memory from the statusline cache
+STATES_NEEDING_METADATA = frozenset(["thinking", "working", "planning", "packing"])
+
 
 def get_git_root(directory: str) -> str | None:
     """Get git repository root directory."""
@@ -228,8 +340,8 @@ def get_project_name(cwd: str, transcript_path: str) -> str:
     return name if name else "default"
 
 
-def get_state(event_name: str, permission_mode: str = "default") -> str:
-    """Map event name to state, considering permission mode."""
+def _resolve_state(event_name: str, permission_mode: str) -> str:
+    """Map event name to state, considering permission mode (uncached)."""
     state = EVENT_STATE_MAP.get(event_name, "working")
 
     if permission_mode == "plan" and state in ("thinking", "working"):
@@ -238,26 +350,73 @@ def get_state(event_name: str, permission_mode: str = "default") -> str:
     return state
 
 
+# (event, permission mode) to state, precomputed for known combinations
+PERMISSION_MODES = ("default", "plan", "acceptEdits", "bypassPermissions")
+_STATE_LOOKUP: dict[tuple[str, str], str] = {
+    (event, mode): _resolve_state(event, mode)
+    for event in EVENT_STATE_MAP
+    for mode in PERMISSION_MODES
+}
+
+
+def get_state(event_name: str, permission_mode: str = "default") -> str:
+    """Map event name to state, considering permission mode."""
+    state = _STATE_LOOKUP.get((event_name, permission_mode))
+    if state is None:
+        return _resolve_state(event_name, permission_mode)
+    return state
+
+
+# Parsed cache file contents keyed by (path, mtime_ns, size)
+_metadata_cache: dict[tuple[str, int, int], dict[str, Any]] = {}
+
+
 def get_project_metadata(project: str) -> dict[str, Any]:
-    """Get model and memory from cache for a project."""
+    """Get model and memory from cache for a project.
+
+    The parsed cache file is kept in memory and only re-read when its
+    mtime or size changes.
+    """
     if not project:
         return {}
 
     config = get_config()
 
-    if not os.path.exists(config.cache_path):
-        return {}
-
     try:
-        with open(config.cache_path) as f:
-            cache = json.load(f)
-        return cache.get(project, {})
-    except (json.JSONDecodeError, IOError):
+        st = os.stat(config.cache_path)
+    except OSError:
         return {}
 
-
+    key = (config.cache_path, st.st_mtime_ns, st.st_size)
+    cache = _metadata_cache.get(key)
+    if cache is None:
+        try:
+            # Raw read of the whole file; no text wrapper or readahead
+            fd = os.open(config.cache_path, os.O_RDONLY)
+            try:
+                # statusline.py replaces the file atomically, so size the
+                # read from the descriptor actually opened
+                st = os.fstat(fd)
+                buf = os.read(fd, st.st_size)
+            finally:
+                os.close(fd)
+            cache = json_loads(buf)
+        except (ValueError, OSError):
+            return {}
+        key = (config.cache_path, st.st_mtime_ns, st.st_size)
+        if not isinstance(cache, dict):
+            return {}
+        # Evict stale entries for the same path
+        for stale in [k for k in _metadata_cache if k[0] == config.cache_path]:
+            del _metadata_cache[stale]
+        _metadata_cache[key] = cache
+
+    return cache.get(project, {})
+
+
+@lru_cache(maxsize=1)
 def get_terminal_id() -> str:
-    """Get terminal ID from environment."""
+    """Get terminal ID from environment (cached)."""
     iterm_session = os.environ.get("ITERM_SESSION_ID")
     if iterm_session:
         return f"iterm2:{iterm_session}"
@@ -269,9 +428,15 @@ def get_terminal_id() -> str:
     return ""
 
 
-def build_payload(state: str, tool: str, project: str) -> dict[str, Any]:
-    """Build payload dict for sending to monitor."""
-    metadata = get_project_metadata(project)
+def build_payload(
+    state: str, tool: str, project: str, terminal_id: str | None = None
+) -> dict[str, Any]:
+    """Build payload dict for sending to monitor.
+
+    Model and memory are only looked up for states that display them.
+    terminal_id overrides this process's terminal (used by the daemon).
+    """
+    metadata = get_project_metadata(project) if state in STATES_NEEDING_METADATA else {}
 
     return {
         "state": state,
@@ -280,46 +445,131 @@ def build_payload(state: str, tool: str, project: str) -> dict[str, Any]:
         "model": metadata.get("model", ""),
         "memory": metadata.get("memory", 0),
         "character": CHARACTER,
-        "terminalId": get_terminal_id(),
+        "terminalId": get_terminal_id() if terminal_id is None else terminal_id,
     }
 
 # ============================================================================
 # Low-Level Send Functions
 # ============================================================================
 
-def _get_serial_lock_path(port: str) -> str:
-    """Get lock file path for serial port."""
-    return f"/tmp/vibe-monitor-serial-{port.replace('/', '_')}.lock"
-
-
-def _get_serial_debounce_path(port: str) -> str:
-    """Get debounce file path for serial port."""
-    return f"/tmp/vibe-monitor-serial-{port.replace('/', '_')}.debounce"
-
-
-def _get_serial_debounce_lock_path(port: str) -> str:
-    """Get debounce lock file path for serial port."""
-    return f"/tmp/vibe-monitor-serial-{port.replace('/', '_')}.dlock"
+@lru_cache(maxsize=4)
+def _get_serial_paths(port: str) -> tuple[str, str]:
+    """Get (lock, debounce) file paths for serial port (cached)."""
+    base = f"/tmp/vibe-monitor-serial-{port.replace('/', '_')}"
+    return f"{base}.lock", f"{base}.debounce"
 
 
 def _acquire_lock(lock_fd: int, max_retries: int = SERIAL_LOCK_MAX_RETRIES) -> bool:
-    """Try to acquire file lock with retries."""
-    for attempt in range(max_retries):
+    """Try to acquire file lock within max_retries * SERIAL_LOCK_RETRY_INTERVAL.
+
+    Polls with a short, doubling back-off (capped at the retry interval), so
+    a lock released a few ms later is picked up in a few ms. A blocking
+    flock with SIGALRM is not an option: sends run on worker threads.
+    """
+    deadline = time.monotonic() + max_retries * SERIAL_LOCK_RETRY_INTERVAL
+    delay = SERIAL_LOCK_MIN_RETRY_INTERVAL
+    while True:
         try:
             fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
             return True
         except BlockingIOError:
-            if attempt < max_retries - 1:
-                time.sleep(SERIAL_LOCK_RETRY_INTERVAL)
-    return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, SERIAL_LOCK_RETRY_INTERVAL)
+
+
+# Serial port descriptors and configuration state (per process)
+_serial_fds: dict[str, int] = {}
+_serial_configured: set[str] = set()
+
+
+def _close_serial_fds() -> None:
+    """Close all cached serial port descriptors."""
+    for fd in _serial_fds.values():
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    _serial_fds.clear()
+
+
+atexit.register(_close_serial_fds)
+
+
+def _set_baud_rate(fd: int) -> None:
+    """Set the serial line speed in-process (no stty fork/exec)."""
+    try:
+        attrs = termios.tcgetattr(fd)
+        attrs[4] = attrs[5] = getattr(termios, f"B{SERIAL_BAUD_RATE}")
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    except termios.error as e:
+        debug_log(f"Serial configure error: {e}")
+
+
+def _get_serial_fd(port: str) -> int:
+    """Get a configured, write-only descriptor for the serial port (cached).
+
+    Raises FileNotFoundError if the port does not exist.
+    """
+    fd = _serial_fds.get(port)
+    if fd is None:
+        # O_NONBLOCK only so open() can't wait for carrier; writes block
+        fd = os.open(port, os.O_WRONLY | os.O_NONBLOCK | os.O_NOCTTY)
+        try:
+            os.set_blocking(fd, True)
+        except OSError:
+            os.close(fd)
+            raise
+        _serial_fds[port] = fd
+
+    if port not in _serial_configured:
+        # Configure serial port once per process
+        _set_baud_rate(fd)
+        _serial_configured.add(port)
+    return fd
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data, continuing after partial writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _drop_serial_fd(port: str) -> None:
+    """Close and forget the cached descriptor for the serial port."""
+    _serial_configured.discard(port)
+    fd = _serial_fds.pop(port, None)
+    if fd is not None:
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+
+
+def _forget_serial_port(port: str) -> None:
+    """Drop a vanished port: its descriptor and any pattern resolved to it."""
+    _drop_serial_fd(port)
+    for pattern in [pattern for pattern, resolved in _resolved_ports.items() if resolved == port]:
+        del _resolved_ports[pattern]
 
 
 def send_serial_raw(port: str, data: str) -> bool:
     """Send data via serial port with file locking (internal use)."""
-    if not os.path.exists(port):
+    # Opening the port doubles as the existence check
+    try:
+        serial_fd = _get_serial_fd(port)
+    except FileNotFoundError:
+        _forget_serial_port(port)
+        return False
+    except OSError as e:
+        debug_log(f"Serial open error: {e}")
+        _forget_serial_port(port)
         return False
 
-    lock_path = _get_serial_lock_path(port)
+    lock_path, _ = _get_serial_paths(port)
     lock_fd = None
 
     try:
@@ -330,18 +580,12 @@ def send_serial_raw(port: str, data: str) -> bool:
             return False
 
         try:
-            # Configure serial port
-            flag = "-f" if sys.platform == "darwin" else "-F"
-            subprocess.run(
-                ["stty", flag, port, SERIAL_BAUD_RATE],
-                check=False,
-                capture_output=True,
-            )
-
-            # Write data
-            with open(port, "w") as f:
-                f.write(data + "\n")
-                f.flush()
+            try:
+                _write_all(serial_fd, (data + "\n").encode("utf-8"))
+            except OSError:
+                # Device may have been unplugged (or re-enumerated); resolve again next send
+                _forget_serial_port(port)
+                raise
 
             time.sleep(SERIAL_LOCK_RETRY_INTERVAL)
             return True
@@ -359,90 +603,176 @@ def send_serial_raw(port: str, data: str) -> bool:
                 pass
 
 
+def _read_debounce_state(debounce_path: str) -> dict[str, Any] | None:
+    """Read the pending serial update from the debounce file."""
+    try:
+        state = json_load_file(debounce_path)
+    except (IOError, OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _write_debounce_state(debounce_path: str, state: dict[str, Any]) -> None:
+    """Atomically replace the debounce file (write temp file, then rename)."""
+    tmp_path = f"{debounce_path}.{state['id']}"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json_dumps(state))
+        os.replace(tmp_path, debounce_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _flush_serial(port: str, my_id: str) -> None:
+    """Send our update if it is still the latest after the debounce window."""
+    _, debounce_path = _get_serial_paths(port)
+    state = _read_debounce_state(debounce_path)
+    if not state or state.get("id") != my_id:
+        debug_log("Serial debounce: skipped (newer update exists)")
+        return  # The newer writer will send
+
+    debug_log("Serial debounce: sending (we have latest)")
+    send_serial_raw(port, state.get("data", ""))
+
+
 def send_serial(port: str, data: str) -> bool:
     """Send data via serial port with debouncing.
 
-    Uses a debounce file to coalesce rapid updates. Only the last update
-    within the debounce window is actually sent to the serial port.
+    Uses a debounce file to coalesce rapid updates without blocking the
+    caller. Each update atomically replaces the debounce file and schedules
+    a check after SERIAL_DEBOUNCE_MS; only the writer that is still the
+    latest at that point actually sends to the serial port.
     """
-    if not os.path.exists(port):
+    # Only stat here; the device itself is opened by whoever flushes
+    try:
+        os.stat(port)
+    except OSError:
+        _forget_serial_port(port)
         return False
 
-    debounce_path = _get_serial_debounce_path(port)
-    lock_path = _get_serial_debounce_lock_path(port)
-    my_id = str(uuid.uuid4())
+    _, debounce_path = _get_serial_paths(port)
+    # Unique per host: pid plus a monotonic timestamp (no urandom read)
+    my_id = f"{os.getpid()}-{time.monotonic_ns()}"
 
-    lock_fd = None
     try:
-        # Write our payload to the debounce file (with lock)
-        lock_fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
-        fcntl.flock(lock_fd, fcntl.LOCK_EX)
-        try:
-            with open(debounce_path, "w") as f:
-                json.dump({"id": my_id, "data": data, "time": time.time()}, f)
-        finally:
-            fcntl.flock(lock_fd, fcntl.LOCK_UN)
-            os.close(lock_fd)
-            lock_fd = None
+        _write_debounce_state(debounce_path, {"id": my_id, "data": data, "time": time.time()})
+    except (IOError, OSError) as e:
+        debug_log(f"Serial debounce error: {e}, falling back to direct send")
+        return send_serial_raw(port, data)
 
-        # Wait for debounce period
-        time.sleep(SERIAL_DEBOUNCE_MS / 1000.0)
+    # Non-daemon timer: the process waits for the flush before exiting
+    threading.Timer(SERIAL_DEBOUNCE_MS / 1000.0, _flush_serial, args=(port, my_id)).start()
+    return True
 
-        # Check if we're still the latest (with lock)
-        lock_fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
-        fcntl.flock(lock_fd, fcntl.LOCK_EX)
-        try:
-            with open(debounce_path) as f:
-                state = json.load(f)
 
-            if state["id"] != my_id:
-                debug_log("Serial debounce: skipped (newer update exists)")
-                return True  # Another process will send
+# Idle keep-alive connections keyed by (scheme, host:port)
+_http_pool: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+_http_pool_lock = threading.Lock()
 
-            debug_log("Serial debounce: sending (we have latest)")
-            return send_serial_raw(port, state["data"])
-        finally:
-            fcntl.flock(lock_fd, fcntl.LOCK_UN)
-            os.close(lock_fd)
-            lock_fd = None
 
-    except (IOError, OSError, json.JSONDecodeError) as e:
-        debug_log(f"Serial debounce error: {e}, falling back to direct send")
-        return send_serial_raw(port, data)
-    finally:
-        if lock_fd is not None:
-            try:
-                os.close(lock_fd)
-            except OSError:
-                pass
+@lru_cache(maxsize=16)
+def _uses_proxy(scheme: str, host: str) -> bool:
+    """Check whether urllib would route this URL through a proxy (HTTP(S)_PROXY, NO_PROXY)."""
+    import urllib.request
 
+    return scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(host)
 
-def send_http_post(url: str, endpoint: str, data: str | None = None) -> tuple[bool, str | None]:
-    """Send HTTP POST request."""
+
+def _urlopen_request(
+    method: str, full_url: str, body: bytes | None, headers: dict[str, str] | None
+) -> tuple[int, bytes]:
+    """Send HTTP request with urlopen (proxy support; no connection reuse)."""
+    import urllib.error
+    import urllib.request
+
+    request = urllib.request.Request(full_url, data=body, headers=headers or {}, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT_SECONDS) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def _http_request(
+    method: str, full_url: str, body: bytes | None = None, headers: dict[str, str] | None = None
+) -> tuple[int, bytes]:
+    """Send HTTP request over a pooled keep-alive connection.
+
+    URLs that the environment routes through a proxy go through urlopen.
+
+    Returns: (status, response_body)
+    Raises: OSError or http.client.HTTPException on failure
+    """
+    parts = urlsplit(full_url)
+    if _uses_proxy(parts.scheme, parts.hostname or ""):
+        return _urlopen_request(method, full_url, body, headers)
+    key = (parts.scheme, parts.netloc)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    with _http_pool_lock:
+        idle = _http_pool.get(key)
+        conn = idle.pop() if idle else None
+    reused = conn is not None
+
+    while True:
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(parts.netloc, timeout=HTTP_TIMEOUT_SECONDS)
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            response = conn.getresponse()
+            result = response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            if not reused:
+                raise
+            # Stale keep-alive connection; retry once on a fresh one
+            conn = None
+            reused = False
+            continue
+        break
+
+    if response.will_close:
+        conn.close()
+    else:
+        with _http_pool_lock:
+            _http_pool.setdefault(key, []).append(conn)
+    return result
+
+
+def send_http_post(url: str, endpoint: str, data: str | bytes | None = None) -> tuple[bool, str | None]:
+    """Send HTTP POST request (data may be pre-encoded bytes)."""
     try:
-        full_url = f"{url}{endpoint}"
         if data:
-            req = Request(
-                full_url,
-                data=data.encode("utf-8"),
-                headers={"Content-Type": "application/json"},
-                method="POST",
+            status, body = _http_request(
+                "POST",
+                f"{url}{endpoint}",
+                data.encode("utf-8") if isinstance(data, str) else data,
+                {"Content-Type": "application/json"},
             )
         else:
-            req = Request(full_url, method="POST")
-
-        with urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as response:
-            return True, response.read().decode("utf-8")
-    except (URLError, TimeoutError, OSError):
+            status, body = _http_request("POST", f"{url}{endpoint}")
+        if status >= 400:
+            return False, None
+        return True, body.decode("utf-8")
+    except (OSError, http.client.HTTPException, ValueError):
         return False, None
 
 
 def send_http_get(url: str, endpoint: str) -> tuple[bool, str | None]:
     """Send HTTP GET request."""
     try:
-        with urlopen(f"{url}{endpoint}", timeout=HTTP_TIMEOUT_SECONDS) as response:
-            return True, response.read().decode("utf-8")
-    except (URLError, TimeoutError, OSError):
+        status, body = _http_request("GET", f"{url}{endpoint}")
+        if status >= 400:
+            return False, None
+        return True, body.decode("utf-8")
+    except (OSError, http.client.HTTPException, ValueError):
         return False, None
 
 
@@ -456,7 +786,7 @@ def send_vibemon_api(url: str, token: str, payload: dict[str, Any]) -> bool:
     try:
         api_url = f"{url.rstrip('/')}/status"
         # VibeMon API doesn't need terminalId
-        api_payload = json.dumps({
+        api_payload = json_dumps({
             "state": payload.get("state", ""),
             "project": payload.get("project", ""),
             "tool": payload.get("tool", ""),
@@ -465,20 +795,19 @@ def send_vibemon_api(url: str, token: str, payload: dict[str, Any]) -> bool:
             "character": payload.get("character", CHARACTER),
         })
 
-        req = Request(
+        status, _ = _http_request(
+            "POST",
             api_url,
-            data=api_payload.encode("utf-8"),
-            headers={
+            api_payload.encode("utf-8"),
+            {
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {token}",
             },
-            method="POST",
         )
-
-        with urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as response:
-            debug_log(f"VibeMon API response: {response.status}")
-            return response.status == 200
-    except (URLError, TimeoutError, OSError) as e:
+        if DEBUG:
+            debug_log(f"VibeMon API response: {status}")
+        return status == 200
+    except (OSError, http.client.HTTPException, ValueError) as e:
         debug_log(f"VibeMon API error: {e}")
         return False
 
@@ -496,40 +825,74 @@ def _send_http_request(
     return send_http_get(url, endpoint)
 
 
-def is_localhost_url(url: str) -> bool:
-    """Check if URL is localhost (Desktop App)."""
-    return "127.0.0.1" in url or "localhost" in url
-
-
 def try_http_targets(
     endpoint: str,
     data: str | None = None,
     method: str = "POST",
     include_localhost: bool = True,
+    config: Config | None = None,
 ) -> tuple[bool, str | None]:
-    """Try HTTP targets in order.
+    """Try HTTP targets in order, localhost (Desktop App) first.
+
+    Commands (POST) go to one target at a time and stop at the first
+    success, so only one device is locked/changed. Queries (GET) have no
+    side effects and are sent to all targets at once; the answer still
+    comes from the earliest target in that order that succeeds.
 
     Returns: (success, result_text)
     """
-    config = get_config()
+    if config is None:
+        config = get_config()
+
+    urls = config.command_urls if include_localhost else config.remote_urls
+    if method == "POST" or len(urls) <= 1:
+        for url in urls:
+            debug_log(f"Trying HTTP: {url}")
+            success, result = _send_http_request(url, endpoint, data, method)
+            if success:
+                return True, result
+        return False, None
 
-    for url in config.http_urls:
-        if not include_localhost and is_localhost_url(url):
-            continue
+    results: queue.Queue = queue.Queue()
+
+    def attempt(index: int, url: str) -> None:
+        outcome: tuple[bool, str | None] = (False, None)
+        try:
+            outcome = _send_http_request(url, endpoint, data, method)
+        finally:
+            # Always report, so the collector below never waits forever
+            results.put((index, outcome))
+
+    # Daemon threads: a slow URL must not hold up exit once a result is in
+    for index, url in enumerate(urls):
         debug_log(f"Trying HTTP: {url}")
-        success, result = _send_http_request(url, endpoint, data, method)
-        if success:
-            return True, result
+        threading.Thread(target=attempt, args=(index, url), daemon=True).start()
+
+    # Deterministic answer: the first success in URL order
+    done: dict[int, tuple[bool, str | None]] = {}
+    next_index = 0
+    while next_index < len(urls):
+        index, outcome = results.get()
+        done[index] = outcome
+        while next_index in done:
+            success, result = done[next_index]
+            if success:
+                return True, result
+            next_index += 1
 
     return False, None
 
 
-def try_serial_target(command_data: str) -> tuple[bool, str | None]:
-    """Try Serial target.
+def try_serial_target(command: dict[str, Any], config: Config | None = None) -> tuple[bool, str | None]:
+    """Try Serial target (command is serialized only if a port is found).
+
+    Commands are written synchronously, not debounced, so the result
+    reflects the actual write.
 
     Returns: (success, resolved_port)
     """
-    config = get_config()
+    if config is None:
+        config = get_config()
 
     if not config.serial_port:
         return False, None
@@ -539,7 +902,7 @@ def try_serial_target(command_data: str) -> tuple[bool, str | None]:
         return False, None
 
     debug_log(f"Trying Serial: {resolved_port}")
-    if send_serial(resolved_port, command_data):
+    if send_serial_raw(resolved_port, json_dumps(command)):
         return True, resolved_port
 
     return False, None
@@ -548,20 +911,22 @@ def try_serial_target(command_data: str) -> tuple[bool, str | None]:
 def try_all_targets(
     endpoint: str,
     http_data: str | None,
-    serial_command: str,
+    serial_command: dict[str, Any],
     include_localhost: bool = True,
 ) -> tuple[bool, str | None]:
     """Try all targets: HTTP → Serial.
 
     Returns: (success, result_text or None)
     """
+    config = get_config()
+
     # Try HTTP targets first
-    success, result = try_http_targets(endpoint, http_data, "POST", include_localhost)
+    success, result = try_http_targets(endpoint, http_data, "POST", include_localhost, config)
     if success:
         return True, result
 
     # Try Serial
-    success, _ = try_serial_target(serial_command)
+    success, _ = try_serial_target(serial_command, config)
     if success:
         return True, None  # Serial doesn't return response
 
@@ -571,22 +936,26 @@ def try_all_targets(
 # Command Functions
 # ============================================================================
 
-def _print_result(result: str | None, fallback: str) -> None:
-    """Print result or fallback message."""
-    print(result if result else fallback)
+def _print_result(result: str | None, fallback: bytes) -> None:
+    """Print result or write the pre-encoded fallback message."""
+    if result:
+        print(result)
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(fallback)
 
 
 def send_lock(project: str) -> bool:
     """Lock the monitor to a specific project."""
     debug_log(f"Locking project: {project}")
 
-    http_data = json.dumps({"project": project})
-    serial_data = json.dumps({"command": "lock", "project": project})
+    http_data = f'{{"project":{json_dumps(project)}}}'
+    serial_command = {"command": "lock", "project": project}
 
-    success, result = try_all_targets("/lock", http_data, serial_data)
+    success, result = try_all_targets("/lock", http_data, serial_command)
 
     if success:
-        _print_result(result, f'{{"success":true,"locked":"{project}"}}')
+        _print_result(result, OK_LOCKED_PREFIX + project.encode("utf-8") + OK_STRING_SUFFIX)
         return True
 
     debug_log("No monitor target available")
@@ -598,11 +967,11 @@ def send_unlock() -> bool:
     """Unlock the monitor."""
     debug_log("Unlocking")
 
-    serial_data = json.dumps({"command": "unlock"})
-    success, result = try_all_targets("/unlock", None, serial_data)
+    serial_command = {"command": "unlock"}
+    success, result = try_all_targets("/unlock", None, serial_command)
 
     if success:
-        _print_result(result, '{"success":true,"locked":null}')
+        _print_result(result, OK_UNLOCKED)
         return True
 
     debug_log("No monitor target available")
@@ -619,8 +988,8 @@ def get_status() -> bool:
         return True
 
     # Try Serial (can't read response)
-    serial_data = json.dumps({"command": "status"})
-    success, _ = try_serial_target(serial_data)
+    serial_command = {"command": "status"}
+    success, _ = try_serial_target(serial_command)
     if success:
         print('{"info":"Status command sent via serial. Check device output."}')
         return True
@@ -639,8 +1008,8 @@ def get_lock_mode() -> bool:
         return True
 
     # Try Serial (can't read response)
-    serial_data = json.dumps({"command": "lock-mode"})
-    success, _ = try_serial_target(serial_data)
+    serial_command = {"command": "lock-mode"}
+    success, _ = try_serial_target(serial_command)
     if success:
         print('{"info":"Lock-mode command sent via serial. Check device output."}')
         return True
@@ -658,13 +1027,14 @@ def set_lock_mode(mode: str) -> bool:
 
     debug_log(f"Setting lock mode: {mode}")
 
-    http_data = json.dumps({"mode": mode})
-    serial_data = json.dumps({"command": "lock-mode", "mode": mode})
+    # mode is one of VALID_LOCK_MODES: nothing to escape
+    http_data = f'{{"mode":"{mode}"}}'
+    serial_command = {"command": "lock-mode", "mode": mode}
 
-    success, result = try_all_targets("/lock-mode", http_data, serial_data)
+    success, result = try_all_targets("/lock-mode", http_data, serial_command)
 
     if success:
-        _print_result(result, f'{{"success":true,"lockMode":"{mode}"}}')
+        _print_result(result, OK_LOCK_MODE_PREFIX + mode.encode("utf-8") + OK_STRING_SUFFIX)
         return True
 
     debug_log("No monitor target available")
@@ -676,13 +1046,13 @@ def send_reboot() -> bool:
     """Reboot the ESP32 device."""
     debug_log("Rebooting ESP32")
 
-    serial_data = json.dumps({"command": "reboot"})
+    serial_command = {"command": "reboot"}
 
     # ESP32 only - don't include localhost (Desktop)
-    success, result = try_all_targets("/reboot", None, serial_data, include_localhost=False)
+    success, result = try_all_targets("/reboot", None, serial_command, include_localhost=False)
 
     if success:
-        _print_result(result, '{"success":true,"rebooting":true}')
+        _print_result(result, OK_REBOOTING)
         return True
 
     debug_log("No ESP32 target available")
@@ -694,9 +1064,14 @@ def send_reboot() -> bool:
 # ============================================================================
 
 def is_monitor_running(url: str) -> bool:
-    """Check if monitor is running."""
-    success, _ = send_http_get(url, "/health")
-    return success
+    """Check if monitor is running (a TCP connect, no HTTP round trip)."""
+    parts = urlsplit(url)
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        with socket.create_connection((parts.hostname, port), timeout=DESKTOP_PROBE_TIMEOUT_SECONDS):
+            return True
+    except (OSError, ValueError):
+        return False
 
 
 def show_monitor_window(url: str) -> None:
@@ -704,8 +1079,9 @@ def show_monitor_window(url: str) -> None:
     send_http_post(url, "/show")
 
 
+@lru_cache(maxsize=1)
 def get_user_shell() -> str:
-    """Get user's login shell."""
+    """Get user's login shell (cached)."""
     shell = os.environ.get("SHELL")
     if shell:
         return shell
@@ -737,28 +1113,114 @@ def launch_desktop() -> None:
         debug_log(f"Failed to launch Desktop App: {e}")
 
 
-def get_desktop_url(http_urls: tuple[str, ...]) -> str | None:
-    """Get first localhost URL (Desktop App) from HTTP URLs."""
-    for url in http_urls:
-        if is_localhost_url(url):
-            return url
-    return None
+def ensure_desktop(url: str) -> None:
+    """Launch Desktop App if it is not running, then show its window."""
+    if not is_monitor_running(url):
+        debug_log("Desktop App not running, launching...")
+        launch_desktop()
+    show_monitor_window(url)
+
+
+# Held while a daemon-side launch runs, so start events don't stack launches
+_desktop_launch_lock = threading.Lock()
+
+
+def ensure_desktop_async(url: str) -> None:
+    """Run ensure_desktop on the send executor (daemon mode).
+
+    The probe, launch and DESKTOP_LAUNCH_WAIT_SECONDS wait then never hold
+    up the daemon's event queue.
+    """
+    if not _desktop_launch_lock.acquire(blocking=False):
+        return  # A launch is already in progress
+
+    def run() -> None:
+        try:
+            ensure_desktop(url)
+        finally:
+            _desktop_launch_lock.release()
+
+    _get_send_executor().submit(run)
+
+
+def ensure_desktop_background(url: str) -> None:
+    """Run ensure_desktop in a detached child process.
+
+    Uses fork on POSIX systems so the health check and launch wait don't
+    block the hook, falls back to synchronous launch on Windows or if fork
+    fails.
+    """
+    if not hasattr(os, "fork"):
+        ensure_desktop(url)
+        return
+
+    try:
+        pid = os.fork()
+        if pid == 0:
+            # Child process - detach, launch and exit
+            try:
+                os.setsid()
+                # Release the hook's stdio so its reader sees EOF now
+                devnull = os.open(os.devnull, os.O_RDWR)
+                for fd in (0, 1, 2):
+                    os.dup2(devnull, fd)
+                ensure_desktop(url)
+            except Exception:
+                pass
+            os._exit(0)
+        # Parent process continues immediately
+    except OSError:
+        # Fork failed - launch synchronously
+        ensure_desktop(url)
+
+
+_send_executor: ThreadPoolExecutor | None = None
+_send_executor_lock = threading.Lock()
+
+
+def _get_send_executor() -> ThreadPoolExecutor:
+    """Get the shared send executor (created on first use)."""
+    global _send_executor
+    if _send_executor is None:
+        with _send_executor_lock:
+            if _send_executor is None:
+                _send_executor = ThreadPoolExecutor(
+                    max_workers=MAX_SEND_WORKERS, thread_name_prefix="vibemon-send"
+                )
+    return _send_executor
 
 
-def send_to_all(payload: dict[str, Any], is_start: bool = False) -> None:
+def _run_send_task(name: str, task: Any) -> None:
+    """Run a send task on the calling thread and log its outcome."""
+    try:
+        success = task()
+        if DEBUG:
+            debug_log(f"Sent to {name}" if success else f"{name} failed")
+    except Exception as e:
+        debug_log(f"{name} failed with error: {e}")
+
+
+def send_to_all(
+    payload: dict[str, Any], is_start: bool = False, detach_launch: bool = True
+) -> None:
     """Send payload to all configured targets concurrently."""
     config = get_config()
 
-    # Launch Desktop App if not running (on start) - must be sequential
-    desktop_url = get_desktop_url(config.http_urls)
+    # Nothing to do without targets - skip serialization and port lookup
+    if not config.http_urls and not config.serial_port and not (config.vibemon_url and config.vibemon_token):
+        return
+
+    # Launch Desktop App if not running (on start) - off the critical path
+    desktop_url = config.desktop_url
     if desktop_url and is_start and config.auto_launch:
-        if not is_monitor_running(desktop_url):
-            debug_log("Desktop App not running, launching...")
-            launch_desktop()
-        show_monitor_window(desktop_url)
+        if detach_launch:
+            ensure_desktop_background(desktop_url)
+        else:
+            ensure_desktop_async(desktop_url)
 
-    # Convert to JSON string once for HTTP/Serial targets
-    payload_str = json.dumps(payload)
+    # Serialize and encode once: str for the serial debounce file, bytes for HTTP
+    payload_str = json_dumps(payload)
+    payload_bytes = payload_str.encode("utf-8")
 
     # Resolve serial port once
     resolved_port: str | None = None
@@ -770,11 +1232,11 @@ def send_to_all(payload: dict[str, Any], is_start: bool = False) -> None:
     # Build list of tasks to run in parallel
     tasks: list[tuple[str, Any]] = []
 
-    for url in config.http_urls:
+    for url, is_local in zip(config.http_urls, config.is_localhost):
         # Capture url in closure
         u = url
-        label = "Desktop App" if is_localhost_url(url) else f"HTTP ({url})"
-        tasks.append((label, lambda u=u: send_http_post(u, "/status", payload_str)[0]))
+        label = "Desktop App" if is_local else f"HTTP ({url})"
+        tasks.append((label, lambda u=u: send_http_post(u, "/status", payload_bytes)[0]))
 
     if resolved_port:
         # Capture resolved_port in closure
@@ -791,16 +1253,24 @@ def send_to_all(payload: dict[str, Any], is_start: bool = False) -> None:
     if not tasks:
         return
 
-    # Execute all tasks concurrently
-    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
-        future_to_name = {executor.submit(task): name for name, task in tasks}
-        for future in as_completed(future_to_name):
-            name = future_to_name[future]
-            try:
-                success = future.result()
+    # Run the last task on this thread; only the others need worker threads
+    *background, (local_name, local_task) = tasks
+    if not background:
+        _run_send_task(local_name, local_task)
+        return
+
+    # Workers (and their pooled connections) persist between daemon events
+    executor = _get_send_executor()
+    future_to_name = {executor.submit(task): name for name, task in background}
+    _run_send_task(local_name, local_task)
+    for future in as_completed(future_to_name):
+        name = future_to_name[future]
+        try:
+            success = future.result()
+            if DEBUG:
                 debug_log(f"Sent to {name}" if success else f"{name} failed")
-            except Exception as e:
-                debug_log(f"{name} failed with error: {e}")
+        except Exception as e:
+            debug_log(f"{name} failed with error: {e}")
 
 # ============================================================================
 # Command Handlers
@@ -813,6 +1283,7 @@ COMMAND_HANDLERS: dict[str, Any] = {
     "--status": lambda args: get_status(),
     "--lock-mode": lambda args: set_lock_mode(args[0]) if args else get_lock_mode(),
     "--reboot": lambda args: send_reboot(),
+    "--daemon": lambda args: run_daemon(),
 }
 
 
@@ -825,21 +1296,141 @@ def handle_command(cmd: str, args: list[str]) -> bool | None:
 
 
 # ============================================================================
-# Main
+# Daemon
 # ============================================================================
 
-def main() -> None:
-    """Main entry point."""
-    # Check for command modes
-    if len(sys.argv) > 1:
-        cmd = sys.argv[1]
-        args = sys.argv[2:]
-        result = handle_command(cmd, args)
-        if result is not None:
-            sys.exit(0 if result else 1)
+def forward_to_daemon(input_raw: bytes) -> bool:
+    """Hand the hook input to a running daemon.
 
-    # Read and parse input once
-    input_raw = read_input()
+    Wire format: terminal ID line, then the raw hook JSON. The daemon
+    replies with a single byte once the event is queued.
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(DAEMON_CONNECT_TIMEOUT_SECONDS)
+            sock.connect(DAEMON_SOCKET_PATH)
+            sock.sendall(get_terminal_id().encode("utf-8") + b"\n" + input_raw)
+            sock.shutdown(socket.SHUT_WR)
+            return sock.recv(1) == b"1"
+    except OSError:
+        return False
+
+
+def spawn_daemon() -> None:
+    """Start the daemon in a detached process for subsequent events."""
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--daemon"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as e:
+        debug_log(f"Failed to start daemon: {e}")
+
+
+def _get_config_mtime() -> int | None:
+    """Get config.json mtime (daemon restarts when it changes)."""
+    try:
+        return os.stat(Path.home() / ".vibemon" / "config.json").st_mtime_ns
+    except OSError:
+        return None
+
+
+def _daemon_worker(events: queue.Queue) -> None:
+    """Process queued events sequentially until the None sentinel."""
+    while True:
+        item = events.get()
+        if item is None:
+            return
+        terminal_id, input_raw = item
+        try:
+            handle_event(input_raw, terminal_id, detach_launch=False)
+        except Exception as e:
+            debug_log(f"Daemon event error: {e}")
+
+
+def run_daemon() -> bool:
+    """Serve hook events over a UNIX socket.
+
+    Keeps config, HTTP connections, serial descriptors and the statusline
+    cache warm across events. Exits after DAEMON_IDLE_TIMEOUT_SECONDS
+    without events, or when config.json changes.
+    """
+    os.makedirs(os.path.dirname(DAEMON_SOCKET_PATH), exist_ok=True)
+
+    # Single instance: hold the lock for the daemon's lifetime
+    lock_fd = os.open(DAEMON_LOCK_PATH, os.O_CREAT | os.O_RDWR, 0o600)
+    try:
+        fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(lock_fd)
+        return True  # Another daemon is running
+
+    config_mtime = _get_config_mtime()
+    events: queue.Queue = queue.Queue()
+    worker = threading.Thread(target=_daemon_worker, args=(events,))
+    worker.start()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            os.unlink(DAEMON_SOCKET_PATH)
+        except FileNotFoundError:
+            pass
+        old_umask = os.umask(0o077)
+        try:
+            server.bind(DAEMON_SOCKET_PATH)
+        finally:
+            os.umask(old_umask)
+        server.listen(16)
+        server.settimeout(DAEMON_IDLE_TIMEOUT_SECONDS)
+        debug_log(f"Daemon listening on {DAEMON_SOCKET_PATH}")
+
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                debug_log("Daemon idle, exiting")
+                break
+
+            with conn:
+                try:
+                    conn.settimeout(DAEMON_CONNECT_TIMEOUT_SECONDS)
+                    chunks = []
+                    while chunk := conn.recv(65536):
+                        chunks.append(chunk)
+                    terminal_line, _, input_raw = b"".join(chunks).partition(b"\n")
+                    events.put((terminal_line.decode("utf-8", "replace"), input_raw))
+                    conn.sendall(b"1")
+                except OSError as e:
+                    debug_log(f"Daemon receive error: {e}")
+
+            if _get_config_mtime() != config_mtime:
+                debug_log("Config changed, daemon exiting")
+                break
+    finally:
+        server.close()
+        try:
+            os.unlink(DAEMON_SOCKET_PATH)
+        except OSError:
+            pass
+        events.put(None)
+        worker.join()
+        os.close(lock_fd)
+
+    return True
+
+
+# ============================================================================
+# Main
+# ============================================================================
+
+def handle_event(
+    input_raw: bytes, terminal_id: str | None = None, detach_launch: bool = True
+) -> None:
+    """Process a single hook event."""
     data = parse_json(input_raw)
 
     # Extract fields from parsed data
@@ -852,13 +1443,38 @@ def main() -> None:
     project_name = get_project_name(cwd, transcript_path)
     state = get_state(event_name, permission_mode)
 
-    debug_log(f"Event: {event_name}, Tool: {tool_name}, Project: {project_name}")
+    if DEBUG:
+        debug_log(f"Event: {event_name}, Tool: {tool_name}, Project: {project_name}")
 
-    payload = build_payload(state, tool_name, project_name)
-    debug_log(f"Payload: {json.dumps(payload)}")
+    payload = build_payload(state, tool_name, project_name, terminal_id)
+    if DEBUG:
+        # Serializing only to log it is skipped unless debugging
+        debug_log(f"Payload: {json_dumps(payload)}")
 
     is_start = event_name == "SessionStart"
-    send_to_all(payload, is_start)
+    send_to_all(payload, is_start, detach_launch)
+
+
+def main() -> None:
+    """Main entry point."""
+    # Check for command modes
+    if len(sys.argv) > 1:
+        cmd = sys.argv[1]
+        args = sys.argv[2:]
+        result = handle_command(cmd, args)
+        if result is not None:
+            sys.exit(0 if result else 1)
+
+    # Read input once
+    input_raw = read_input()
+
+    # Hand off to the daemon if enabled; start one for next time otherwise
+    if get_config().daemon:
+        if forward_to_daemon(input_raw):
+            return
+        spawn_daemon()
+
+    handle_event(input_raw)
 
 
 if __name__ == "__main__":
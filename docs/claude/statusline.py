@@ -6,14 +6,44 @@ Displays status line and sends context usage to VibeMon
 
 from __future__ import annotations
 
-import fcntl
-import json
+import atexit
 import os
-import subprocess
 import sys
+import threading
 import time
+from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+# ============================================================================
+# JSON Helpers
+# ============================================================================
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    import json
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+def json_load_file(path: str) -> Any:
+    """Read and parse a JSON file."""
+    with open(path, "rb") as f:
+        return json_loads(f.read())
 
 # ============================================================================
 # Configuration Loading
@@ -26,9 +56,8 @@ def load_config() -> None:
         return
 
     try:
-        with open(config_file) as f:
-            config = json.load(f)
-    except (json.JSONDecodeError, IOError):
+        config = json_load_file(str(config_file))
+    except (ValueError, IOError):
         return
 
     # Map config keys to environment variables
@@ -57,6 +86,21 @@ VIBE_MONITOR_MAX_PROJECTS = 10
 LOCK_TIMEOUT_SECONDS = 5
 LOCK_RETRY_INTERVAL = 0.05
 
+# Unchanged cache entries are only rewritten (ts refresh) after this long
+CACHE_REFRESH_SECONDS = 60
+
+# Git dirty-state cache lifetime
+GIT_CACHE_TTL_SECONDS = 60
+
+# git status limits: the statusline waits at most GIT_STATUS_WAIT_SECONDS,
+# then shows the last known state while a detached child finishes the check
+GIT_STATUS_WAIT_SECONDS = 0.05
+GIT_STATUS_TIMEOUT_SECONDS = 2
+
+# Options for read-only status checks: no optional index lock/refresh
+# writes, no auto gc (Popen finds git on PATH only when it actually runs)
+GIT_COMMAND = ["git", "--no-optional-locks", "-c", "gc.auto=0"]
+
 # ============================================================================
 # Utility Functions
 # ============================================================================
@@ -68,10 +112,17 @@ def read_input() -> str:
 def parse_json(data: str) -> dict[str, Any]:
     """Parse JSON string to dictionary."""
     try:
-        return json.loads(data)
-    except (json.JSONDecodeError, TypeError):
+        return json_loads(data)
+    except (ValueError, TypeError):
         return {}
 
+# Shared read-only empty mapping (no allocation for missing sections)
+EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+def as_mapping(obj: Any) -> Mapping[str, Any]:
+    """Return obj if it is a dict, otherwise the shared empty mapping."""
+    return obj if isinstance(obj, dict) else EMPTY
+
 def get_nested_value(obj: dict[str, Any], field: str, default: Any = "") -> Any:
     """Get nested value from dictionary using dot notation."""
     keys = field.strip(".").split(".")
@@ -82,6 +133,27 @@ def get_nested_value(obj: dict[str, Any], field: str, default: Any = "") -> Any:
             return default
     return obj if obj is not None else default
 
+def write_file_atomic(path: str, text: str) -> None:
+    """Replace path with text atomically (temp file + rename).
+
+    The temp file is removed again if the write fails.
+    Raises OSError on failure.
+    """
+    tmpfile = f"{path}.tmp.{os.getpid()}"
+    fd = os.open(tmpfile, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        try:
+            os.write(fd, text.encode("utf-8"))
+        finally:
+            os.close(fd)
+        os.replace(tmpfile, path)  # os.replace is atomic on POSIX
+    except OSError:
+        try:
+            os.unlink(tmpfile)
+        except OSError:
+            pass
+        raise
+
 # ============================================================================
 # Git Functions
 # ============================================================================
@@ -108,122 +180,316 @@ BRANCH_EMOJIS = {
     "exp": "🧪",
 }
 
+# Longest branch name/prefix that can match; nothing past it is examined
+BRANCH_KEY_MAXLEN = max(len(key) for key in BRANCH_EMOJIS)
+
 def get_branch_emoji(branch: str) -> str:
     """Get emoji for branch based on name or prefix."""
     if not branch:
         return "🌿"
 
-    branch_lower = branch.lower()
+    # Only the first BRANCH_KEY_MAXLEN + 1 chars can hold a key and its "/"
+    head = branch[:BRANCH_KEY_MAXLEN + 1]
+    head = head if head.islower() else head.lower()
 
-    # Check exact match first (main, master, develop, etc.)
-    if branch_lower in BRANCH_EMOJIS:
-        return BRANCH_EMOJIS[branch_lower]
+    slash = head.find("/")
+    if slash == -1:
+        # Exact match (main, master, develop, etc.)
+        if len(branch) > BRANCH_KEY_MAXLEN:
+            return "🌿"
+        return BRANCH_EMOJIS.get(head, "🌿")
 
-    # Check prefix match (feature/xxx, fix/xxx, etc.)
-    if "/" in branch_lower:
-        prefix = branch_lower.split("/", 1)[0]
-        if prefix in BRANCH_EMOJIS:
-            return BRANCH_EMOJIS[prefix]
+    # Prefix match (feature/xxx, fix/xxx, etc.)
+    return BRANCH_EMOJIS.get(head[:slash], "🌿")
 
-    # Default emoji
-    return "🌿"
+def find_git_dir(directory: str) -> tuple[str, str] | None:
+    """Find the git worktree root and git directory without running git.
 
-def get_git_root(directory: str) -> str | None:
-    """Get git repository root directory."""
-    if not directory:
-        return None
+    Walks up from directory looking for .git (a directory, or a file with
+    "gitdir: <path>" for linked worktrees and submodules).
+
+    Returns: (git_root, git_dir) or None if not inside a repository
+    """
+    # realpath, like git rev-parse --show-toplevel: the hook looks up cache
+    # entries by the same project name for symlinked checkouts
+    current = os.path.realpath(directory)
+    while True:
+        dot_git = os.path.join(current, ".git")
+        if os.path.isdir(dot_git):
+            return current, dot_git
+        if os.path.isfile(dot_git):
+            try:
+                with open(dot_git) as f:
+                    content = f.read(4096).strip()
+            except OSError:
+                return None
+            if not content.startswith("gitdir: "):
+                return None
+            git_dir = os.path.join(current, content[len("gitdir: "):])
+            return current, os.path.normpath(git_dir)
+
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        current = parent
+
+
+def read_git_branch(git_dir: str) -> str:
+    """Read current branch name from HEAD (empty if detached)."""
     try:
-        result = subprocess.run(
-            ["git", "-C", directory, "rev-parse", "--show-toplevel"],
-            capture_output=True,
-            text=True,
-            timeout=2
+        with open(os.path.join(git_dir, "HEAD")) as f:
+            head = f.read(256).strip()
+    except OSError:
+        return ""
+
+    # "ref: refs/heads/<branch>"; a bare SHA means detached HEAD
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):]
+    return ""
+
+
+def start_git_status(git_root: str) -> Any:
+    """Start git status for the worktree (Popen), or None if git cannot run."""
+    # Deferred: only needed when the git state cache misses
+    import subprocess
+
+    try:
+        return subprocess.Popen(
+            [*GIT_COMMAND, "-C", git_root, "status", "--porcelain=v1"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+    except OSError:
+        return None
+
+
+def wait_git_dirty(proc: Any, timeout: float) -> bool | None:
+    """Wait for git status to answer; None if it has not within timeout.
+
+    Only the first byte of output is read: any output means changes, so a
+    huge dirty listing is never collected. EOF with no output means a
+    clean worktree (or a git error).
+    """
+    import select
+
+    try:
+        ready, _, _ = select.select([proc.stdout], [], [], timeout)
+        if not ready:
+            return None
+        return bool(proc.stdout.read(1))
+    except (OSError, ValueError):
+        return False
+
+
+def stop_git_status(proc: Any) -> None:
+    """Kill git status if still running, reap it and close the pipe."""
+    try:
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+    except OSError:
         pass
-    return None
+    proc.stdout.close()
 
 
-def get_project_name(directory: str) -> str:
-    """Get project name from git root or directory basename."""
-    if not directory:
-        return ""
+def finish_git_status_detached(proc: Any, on_result: Callable[[bool], None]) -> bool:
+    """Hand a slow git status over to a detached child process.
+
+    The child waits out the rest of GIT_STATUS_TIMEOUT_SECONDS and passes
+    the answer to on_result; it holds no stdio, so the statusline output
+    is not held open. Returns False if the child could not be forked.
+    """
+    try:
+        pid = os.fork()
+    except OSError:
+        return False
+
+    if pid > 0:
+        proc.stdout.close()
+        return True
 
-    # Try git root first (handles subdirectory cases)
-    git_root = get_git_root(directory)
-    if git_root:
-        name = os.path.basename(git_root)
-        if name:
-            return name
+    # Child process
+    try:
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        dirty = wait_git_dirty(proc, GIT_STATUS_TIMEOUT_SECONDS - GIT_STATUS_WAIT_SECONDS)
+        # Closing the pipe stops git (SIGPIPE) if it is still writing
+        proc.stdout.close()
+        on_result(bool(dirty))
+    finally:
+        os._exit(0)
+
+
+def get_git_cache_path() -> str:
+    """Get the git state cache path (next to the statusline cache)."""
+    return os.path.splitext(get_cache_path())[0] + "-git.json"
 
-    # Fallback to directory basename
-    return os.path.basename(directory)
+
+def _get_git_state_key(git_dir: str) -> tuple[int, int]:
+    """Get (index mtime, HEAD mtime) in ns; 0 if a file is missing."""
+    mtimes = []
+    for name in ("index", "HEAD"):
+        try:
+            mtimes.append(os.stat(os.path.join(git_dir, name)).st_mtime_ns)
+        except OSError:
+            mtimes.append(0)
+    return mtimes[0], mtimes[1]
 
 
-def get_git_info(directory: str) -> str:
-    """Get git branch and status information.
+def _get_worktree_mtime(git_root: str) -> int:
+    """Get newest mtime (ns) among the worktree root and its top-level entries.
 
-    Optimized to use single git command with status --porcelain --branch
-    which provides both branch name and change status in one call.
+    A cheap change signal: catches edits to top-level files and files
+    added/removed in top-level directories, without walking the tree.
     """
-    if not directory:
-        return ""
+    try:
+        newest = os.stat(git_root).st_mtime_ns
+        with os.scandir(git_root) as it:
+            for entry in it:
+                if entry.name == ".git":
+                    continue
+                try:
+                    newest = max(newest, entry.stat(follow_symlinks=False).st_mtime_ns)
+                except OSError:
+                    pass
+    except OSError:
+        return 0
+    return newest
+
 
+def get_git_dirty(git_root: str, git_dir: str) -> bool:
+    """Check worktree changes, reusing a cached result while unchanged.
+
+    The cached answer is reused until the index, HEAD or a top-level
+    worktree entry changes, or it is older than GIT_CACHE_TTL_SECONDS;
+    only then is git status run. If git does not answer within
+    GIT_STATUS_WAIT_SECONDS, the last known state is returned instead.
+    """
+    cache_path = get_git_cache_path()
+    now = time.time()
+
+    cache: dict[str, Any] = {}
     try:
-        # Single git command: get branch and status in one call
-        # --porcelain=v1 --branch gives: "## branch...tracking" as first line
-        # followed by changed files (if any)
-        result = subprocess.run(
-            ["git", "-C", directory, "status", "--porcelain=v1", "--branch"],
-            capture_output=True,
-            text=True,
-            timeout=2
+        cache = json_load_file(cache_path)
+        if not isinstance(cache, dict):
+            cache = {}
+    except (ValueError, IOError):
+        cache = {}
+
+    index_mtime, head_mtime = _get_git_state_key(git_dir)
+    worktree_mtime = _get_worktree_mtime(git_root)
+    entry = cache.get(git_root)
+    if (
+        isinstance(entry, dict)
+        and entry.get("index_mtime_ns") == index_mtime
+        and entry.get("head_mtime_ns") == head_mtime
+        and entry.get("worktree_mtime_ns") == worktree_mtime
+        and now - entry.get("ts", 0) < GIT_CACHE_TTL_SECONDS
+    ):
+        return bool(entry.get("dirty"))
+
+    def store(dirty: bool) -> None:
+        store_git_dirty(cache, cache_path, git_root, git_dir, worktree_mtime, dirty)
+
+    proc = start_git_status(git_root)
+    if proc is None:
+        dirty = False
+    else:
+        dirty = wait_git_dirty(proc, GIT_STATUS_WAIT_SECONDS)
+        if dirty is None and finish_git_status_detached(proc, store):
+            # Slow git (network FS, huge repo): last known state for now;
+            # the child caches the real answer for the next prompt
+            return bool(entry.get("dirty")) if isinstance(entry, dict) else False
+        if dirty is None:
+            remaining = GIT_STATUS_TIMEOUT_SECONDS - GIT_STATUS_WAIT_SECONDS
+            dirty = bool(wait_git_dirty(proc, remaining))
+        stop_git_status(proc)
+
+    store(dirty)
+    return dirty
+
+
+def store_git_dirty(
+    cache: dict[str, Any],
+    cache_path: str,
+    git_root: str,
+    git_dir: str,
+    worktree_mtime: int,
+    dirty: bool,
+) -> None:
+    """Record a git status result in the git state cache."""
+    # git status may refresh the index, so key on the state after it ran
+    index_mtime, head_mtime = _get_git_state_key(git_dir)
+    cache[git_root] = {
+        "index_mtime_ns": index_mtime,
+        "head_mtime_ns": head_mtime,
+        "worktree_mtime_ns": worktree_mtime,
+        "dirty": dirty,
+        "ts": time.time(),
+    }
+    if len(cache) > VIBE_MONITOR_MAX_PROJECTS:
+        sorted_items = sorted(
+            cache.items(),
+            key=lambda x: x[1].get("ts", 0) if isinstance(x[1], dict) else 0,
+            reverse=True
         )
-        if result.returncode != 0:
-            return ""
+        cache = dict(sorted_items[:VIBE_MONITOR_MAX_PROJECTS])
 
-        lines = result.stdout.splitlines()
-        if not lines:
-            return ""
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        write_file_atomic(cache_path, json_dumps(cache))
+    except (IOError, OSError):
+        pass
 
-        # Parse branch from first line: "## branch" or "## branch...origin/branch"
-        header = lines[0]
-        if not header.startswith("## "):
-            return ""
 
-        branch_part = header[3:]  # Remove "## "
-        # Handle "branch...origin/branch [ahead 1]" format
-        branch = branch_part.split("...")[0].split()[0]
+def get_git_bundle(directory: str) -> tuple[str, str, bool] | None:
+    """Get git root, branch and dirty state with a single repository lookup.
 
-        if not branch or branch == "HEAD":
-            # Detached HEAD state
-            return ""
+    The branch is read straight from .git/HEAD; git itself only runs to
+    check whether the worktree has changes, and that result is cached.
+
+    Returns: (git_root, branch, dirty) or None if not inside a repository.
+    branch is empty (and dirty False) for a detached HEAD.
+    """
+    if not directory:
+        return None
 
-        # Check if there are any changes (lines after the header)
-        has_changes = len(lines) > 1
+    found = find_git_dir(directory)
+    if not found:
+        return None
+    git_root, git_dir = found
+
+    branch = read_git_branch(git_dir)
+    if not branch:
+        # Detached HEAD state - no need to check for changes
+        return git_root, "", False
 
-        if has_changes:
-            return f" git:({branch} *)"
-        return f" git:({branch})"
+    return git_root, branch, get_git_dirty(git_root, git_dir)
 
-    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+
+def format_git_info(branch: str, dirty: bool) -> str:
+    """Format branch and dirty state as " git:(branch *)"."""
+    if not branch:
         return ""
+    if dirty:
+        return f" git:({branch} *)"
+    return f" git:({branch})"
 
 # ============================================================================
 # Context Window Functions
 # ============================================================================
 
-def get_context_usage(data: dict[str, Any]) -> str:
+def get_context_usage(data: Mapping[str, Any]) -> int | None:
     """Calculate context window usage percentage.
 
     Args:
         data: Pre-parsed JSON dictionary
+
+    Returns: integer percent, or None if unknown
     """
-    context_window = data.get("context_window", {})
-    if not isinstance(context_window, dict):
-        return ""
+    context_window = as_mapping(data.get("context_window"))
 
     # Try pre-calculated percentage first
     used_pct = context_window.get("used_percentage", 0)
@@ -232,7 +498,7 @@ def get_context_usage(data: dict[str, Any]) -> str:
         try:
             pct = float(used_pct)
             if pct > 0:
-                return f"{int(pct)}%"
+                return int(pct)
         except (ValueError, TypeError):
             pass
 
@@ -240,11 +506,9 @@ def get_context_usage(data: dict[str, Any]) -> str:
     try:
         context_size = int(context_window.get("context_window_size", 0) or 0)
         if context_size <= 0:
-            return ""
+            return None
 
-        current_usage = context_window.get("current_usage", {})
-        if not isinstance(current_usage, dict):
-            return ""
+        current_usage = as_mapping(context_window.get("current_usage"))
 
         input_tokens = int(current_usage.get("input_tokens", 0) or 0)
         cache_creation = int(current_usage.get("cache_creation_input_tokens", 0) or 0)
@@ -252,11 +516,11 @@ def get_context_usage(data: dict[str, Any]) -> str:
 
         current_tokens = input_tokens + cache_creation + cache_read
         if current_tokens > 0:
-            return f"{current_tokens * 100 // context_size}%"
+            return current_tokens * 100 // context_size
     except (ValueError, TypeError):
         pass
 
-    return ""
+    return None
 
 # ============================================================================
 # VibeMon Cache Functions
@@ -267,6 +531,24 @@ def get_cache_path() -> str:
     cache_path = os.environ.get("VIBEMON_CACHE_PATH", "~/.vibemon/cache/statusline.json")
     return os.path.expanduser(cache_path)
 
+def is_cache_current(project: str, model: str, memory: int) -> bool:
+    """Check whether the cache already holds this entry, recently saved.
+
+    Reads without the lock: writers replace the file atomically.
+    """
+    try:
+        cache = json_load_file(get_cache_path())
+    except (ValueError, IOError):
+        return False
+
+    entry = cache.get(project) if isinstance(cache, dict) else None
+    return (
+        isinstance(entry, dict)
+        and entry.get("model") == model
+        and entry.get("memory") == memory
+        and time.time() - entry.get("ts", 0) < CACHE_REFRESH_SECONDS
+    )
+
 def save_to_cache(project: str, model: str, memory: int) -> None:
     """Save project metadata to cache file.
 
@@ -275,6 +557,9 @@ def save_to_cache(project: str, model: str, memory: int) -> None:
     if not project:
         return
 
+    # Deferred: only needed when there is something to save
+    import fcntl
+
     cache_path = get_cache_path()
     cache_dir = os.path.dirname(cache_path)
 
@@ -300,24 +585,22 @@ def save_to_cache(project: str, model: str, memory: int) -> None:
                     return  # Timeout - skip cache update
                 time.sleep(LOCK_RETRY_INTERVAL)
 
-        # Read existing cache or create empty object
+        # Read existing cache (one open, binary); missing or bad -> empty
         cache: dict[str, Any] = {}
-        if os.path.exists(cache_path):
-            try:
-                with open(cache_path) as f:
-                    cache = json.load(f)
-            except (json.JSONDecodeError, IOError):
-                cache = {}
+        try:
+            cache = json_load_file(cache_path)
+        except (ValueError, IOError):
+            cache = {}
 
         # If new project and cache is full, remove oldest to make room
-        if project not in cache and len(cache) >= VIBE_MONITOR_MAX_PROJECTS:
-            # Sort by timestamp and remove oldest
-            sorted_items = sorted(
-                cache.items(),
-                key=lambda x: x[1].get("ts", 0) if isinstance(x[1], dict) else 0,
-                reverse=True
-            )
-            cache = dict(sorted_items[:VIBE_MONITOR_MAX_PROJECTS - 1])
+        if project not in cache:
+            while len(cache) >= VIBE_MONITOR_MAX_PROJECTS:
+                # Evict the oldest entry (linear scan, no full sort)
+                oldest = min(
+                    cache,
+                    key=lambda k: cache[k].get("ts", 0) if isinstance(cache[k], dict) else 0
+                )
+                del cache[oldest]
 
         # Update cache with new project data
         cache[project] = {
@@ -326,11 +609,7 @@ def save_to_cache(project: str, model: str, memory: int) -> None:
             "ts": timestamp
         }
 
-        # Atomic write: write to temp file, then rename
-        tmpfile = f"{cache_path}.tmp.{os.getpid()}"
-        with open(tmpfile, "w") as f:
-            json.dump(cache, f)
-        os.replace(tmpfile, cache_path)  # os.replace is atomic on POSIX
+        write_file_atomic(cache_path, json_dumps(cache))
 
     except (IOError, OSError):
         pass
@@ -357,15 +636,31 @@ C_MAGENTA = "\033[35m"
 C_BLUE = "\033[34m"
 C_ORANGE = "\033[38;5;208m"
 
+# Pre-built segment prefixes (color + icon)
+SEP = " │ "
+DIR_PREFIX = f"{C_BLUE}📂 "
+MODEL_PREFIX = f"{C_MAGENTA}🤖 "
+TOKENS_PREFIX = f"{C_CYAN}📥 "
+TOKENS_OUT = " 📤 "
+COST_PREFIX = f"{C_YELLOW}💰 "
+DURATION_PREFIX = f"{C_DIM}⏱️ "
+ADDED_PREFIX = f"{C_GREEN}+"
+REMOVED_PREFIX = f" {C_RED}-"
+CONTEXT_PREFIX = "🧠 "
+
 # ============================================================================
 # Formatting Functions
 # ============================================================================
 
 def format_number(num: int | float | str | None) -> str:
     """Format number with K/M suffix."""
-    if num is None or num == "null" or num == 0:
+    if not num or num == "null":
         return "0"
 
+    # Fast path: small integers need no float conversion
+    if isinstance(num, int) and num < 1_000:
+        return str(num)
+
     try:
         num_float = float(num)
         int_num = int(num_float)
@@ -381,7 +676,7 @@ def format_number(num: int | float | str | None) -> str:
 
 def format_duration(ms: int | float | str | None) -> str:
     """Format duration in milliseconds to human readable format."""
-    if ms is None or ms == "null" or ms == 0:
+    if not ms or ms == "null":
         return "0s"
 
     try:
@@ -400,7 +695,7 @@ def format_duration(ms: int | float | str | None) -> str:
 
 def format_cost(cost: float | str | None) -> str:
     """Format cost in USD."""
-    if cost is None or cost == "null":
+    if not cost or cost == "null":
         return "$0.00"
 
     try:
@@ -412,28 +707,40 @@ def format_cost(cost: float | str | None) -> str:
 # Progress Bar Functions
 # ============================================================================
 
-def build_progress_bar(percent_str: str | int | float, width: int = 10) -> str:
+PROGRESS_BAR_WIDTH = 10
+BAR_FILLED = "━" * PROGRESS_BAR_WIDTH
+BAR_EMPTY = "╌" * PROGRESS_BAR_WIDTH
+
+def build_progress_bar(percent_str: str | int | float, width: int = PROGRESS_BAR_WIDTH) -> str:
     """Build a colored progress bar.
 
     Args:
         percent_str: Percentage value (can be "85%", "85", 85, or 85.5)
         width: Bar width in characters
     """
-    # Remove % sign if present and convert to string
-    cleaned = str(percent_str).rstrip("%").strip()
+    if isinstance(percent_str, int):
+        # Fast path: already an integer percent
+        percent = percent_str
+    else:
+        # Remove % sign if present and convert to string
+        cleaned = str(percent_str).rstrip("%").strip()
 
-    if not cleaned:
-        return ""
+        if not cleaned:
+            return ""
 
-    # Parse as float first to handle "12.5", then convert to int
-    try:
-        percent = int(float(cleaned))
-    except (ValueError, TypeError):
-        return ""
+        # Parse as float first to handle "12.5", then convert to int
+        try:
+            percent = int(float(cleaned))
+        except (ValueError, TypeError):
+            return ""
 
     # Clamp to valid range
-    percent = max(0, min(100, percent))
+    return render_progress_bar(max(0, min(100, percent)), width)
+
 
+@lru_cache(maxsize=128)
+def render_progress_bar(percent: int, width: int) -> str:
+    """Render the bar for a clamped integer percent (memoized)."""
     filled = percent * width // 100
     empty = width - filled
 
@@ -446,8 +753,12 @@ def build_progress_bar(percent_str: str | int | float, width: int = 10) -> str:
         color = C_GREEN
 
     # Build the bar - filled in color, empty in dim
-    filled_bar = "━" * filled
-    empty_bar = "╌" * empty
+    if width <= PROGRESS_BAR_WIDTH:
+        filled_bar = BAR_FILLED[:filled]
+        empty_bar = BAR_EMPTY[:empty]
+    else:
+        filled_bar = "━" * filled
+        empty_bar = "╌" * empty
 
     return f"{color}{filled_bar}{C_RESET}{C_DIM}{empty_bar}{C_RESET} {percent}%"
 
@@ -459,7 +770,7 @@ def build_statusline(
     model: str,
     dir_name: str,
     git_info: str,
-    context_usage: str,
+    context_usage: int | None,
     input_tokens: int | str,
     output_tokens: int | str,
     cost: float | str,
@@ -468,11 +779,8 @@ def build_statusline(
     lines_removed: int | str,
 ) -> str:
     """Build the status line string."""
-    SEP = " │ "
-    parts: list[str] = []
-
     # Directory (📂 icon)
-    parts.append(f"{C_BLUE}📂 {dir_name}{C_RESET}")
+    parts: list[str] = [f"{DIR_PREFIX}{dir_name}{C_RESET}"]
 
     # Git info (emoji based on branch type)
     if git_info:
@@ -485,36 +793,36 @@ def build_statusline(
 
     # Model (🤖 icon) - remove "Claude " prefix
     short_model = model.removeprefix("Claude ")
-    parts.append(f"{C_MAGENTA}🤖 {short_model}{C_RESET}")
+    parts.append(f"{MODEL_PREFIX}{short_model}{C_RESET}")
 
     # Token usage (📥 in / 📤 out)
     if input_tokens and str(input_tokens) != "0":
         in_fmt = format_number(input_tokens)
         out_fmt = format_number(output_tokens)
-        parts.append(f"{C_CYAN}📥 {in_fmt} 📤 {out_fmt}{C_RESET}")
+        parts.append(f"{TOKENS_PREFIX}{in_fmt}{TOKENS_OUT}{out_fmt}{C_RESET}")
 
     # Cost (💰 icon)
     if cost and str(cost) != "0" and cost != "null":
         cost_fmt = format_cost(cost)
-        parts.append(f"{C_YELLOW}💰 {cost_fmt}{C_RESET}")
+        parts.append(f"{COST_PREFIX}{cost_fmt}{C_RESET}")
 
     # Duration (⏱️ icon)
     if duration and str(duration) != "0" and duration != "null":
         duration_fmt = format_duration(duration)
-        parts.append(f"{C_DIM}⏱️ {duration_fmt}{C_RESET}")
+        parts.append(f"{DURATION_PREFIX}{duration_fmt}{C_RESET}")
 
     # Lines changed (+/-)
     if lines_added and str(lines_added) != "0":
-        lines_part = f"{C_GREEN}+{lines_added}{C_RESET}"
+        lines_part = f"{ADDED_PREFIX}{lines_added}{C_RESET}"
         if lines_removed and str(lines_removed) != "0":
-            lines_part += f" {C_RED}-{lines_removed}{C_RESET}"
+            lines_part += f"{REMOVED_PREFIX}{lines_removed}{C_RESET}"
         parts.append(lines_part)
 
     # Context usage with progress bar (🧠 icon)
-    if context_usage:
+    if context_usage is not None:
         progress_bar = build_progress_bar(context_usage)
         if progress_bar:
-            parts.append(f"🧠 {progress_bar}")
+            parts.append(f"{CONTEXT_PREFIX}{progress_bar}")
 
     return SEP.join(parts)
 
@@ -522,30 +830,37 @@ def build_statusline(
 # Background Cache Save
 # ============================================================================
 
+def _join_cache_thread(thread: threading.Thread) -> None:
+    """Wait (bounded) for the background cache write before exiting."""
+    # Deliver the statusline before waiting on the cache write
+    try:
+        sys.stdout.flush()
+    except (OSError, ValueError):
+        pass
+    thread.join(LOCK_TIMEOUT_SECONDS)
+
+
 def save_cache_background(project: str, model: str, memory: int) -> None:
-    """Save to cache in background process.
+    """Save to cache in a background thread.
 
-    Uses fork on POSIX systems for efficiency, falls back to synchronous
-    save on Windows or if fork fails.
+    The thread overlaps the cache write with building the output
+    instead of forking the interpreter; an atexit hook joins it (bounded
+    by LOCK_TIMEOUT_SECONDS) so the write is not cut off at exit.
+    Nothing is written when the cached entry is already up to date.
     """
-    # Check if fork is available (not on Windows)
-    if not hasattr(os, "fork"):
-        save_to_cache(project, model, memory)
+    if not project or is_cache_current(project, model, memory):
         return
 
+    thread = threading.Thread(
+        target=save_to_cache, args=(project, model, memory), daemon=True
+    )
     try:
-        pid = os.fork()
-        if pid == 0:
-            # Child process - save cache and exit
-            try:
-                save_to_cache(project, model, memory)
-            except Exception:
-                pass
-            os._exit(0)
-        # Parent process continues immediately
-    except OSError:
-        # Fork failed - save synchronously
+        thread.start()
+    except RuntimeError:
+        # Thread could not be started - save synchronously
         save_to_cache(project, model, memory)
+        return
+    atexit.register(_join_cache_thread, thread)
 
 
 # ============================================================================
@@ -556,47 +871,51 @@ def main() -> None:
     """Main entry point."""
     input_raw = read_input()
 
-    # Parse JSON once and reuse
-    data = parse_json(input_raw)
+    # Parse JSON once and coerce each section to a mapping once
+    data = as_mapping(parse_json(input_raw))
+    model_data = as_mapping(data.get("model"))
+    workspace_data = as_mapping(data.get("workspace"))
+    context_window = as_mapping(data.get("context_window"))
+    cost_data = as_mapping(data.get("cost"))
 
     # Extract model info
-    model_data = data.get("model", {})
-    model_display = model_data.get("display_name", "Claude") if isinstance(model_data, dict) else "Claude"
+    model_display = model_data.get("display_name", "Claude")
 
     # Extract workspace info
-    workspace_data = data.get("workspace", {})
-    current_dir = workspace_data.get("current_dir", "") if isinstance(workspace_data, dict) else ""
-    dir_name = get_project_name(current_dir) if current_dir else ""
+    current_dir = workspace_data.get("current_dir", "")
+
+    # Project name and git info from one repository lookup
+    dir_name = ""
+    git_info = ""
+    if current_dir:
+        git_bundle = get_git_bundle(current_dir)
+        if git_bundle:
+            git_root, branch, dirty = git_bundle
+            dir_name = os.path.basename(git_root) or os.path.basename(current_dir)
+            git_info = format_git_info(branch, dirty)
+        else:
+            dir_name = os.path.basename(current_dir)
 
     # Get additional info
-    git_info = get_git_info(current_dir)
     context_usage = get_context_usage(data)
 
     # Extract context window data
-    context_window = data.get("context_window", {})
-    if isinstance(context_window, dict):
-        input_tokens = context_window.get("total_input_tokens", 0)
-        output_tokens = context_window.get("total_output_tokens", 0)
-    else:
-        input_tokens = output_tokens = 0
+    input_tokens = context_window.get("total_input_tokens", 0)
+    output_tokens = context_window.get("total_output_tokens", 0)
 
     # Extract cost data
-    cost_data = data.get("cost", {})
-    if isinstance(cost_data, dict):
-        cost = cost_data.get("total_cost_usd", 0)
-        duration = cost_data.get("total_duration_ms", 0)
-        lines_added = cost_data.get("total_lines_added", 0)
-        lines_removed = cost_data.get("total_lines_removed", 0)
-    else:
-        cost = duration = lines_added = lines_removed = 0
+    cost = cost_data.get("total_cost_usd", 0)
+    duration = cost_data.get("total_duration_ms", 0)
+    lines_added = cost_data.get("total_lines_added", 0)
+    lines_removed = cost_data.get("total_lines_removed", 0)
 
     # Save project metadata to cache in background
-    # Convert "85%" to 85, "" to 0
-    memory_int = int(context_usage.rstrip("%")) if context_usage else 0
+    # Unknown usage is stored as 0
+    memory_int = context_usage or 0
     save_cache_background(dir_name, model_display, memory_int)
 
-    # Output statusline
-    print(
+    # Output statusline (encoded once, written past the text layer)
+    sys.stdout.buffer.write(
         build_statusline(
             model_display,
             dir_name,
@@ -608,8 +927,7 @@ def main() -> None:
             duration,
             lines_added,
             lines_removed,
-        ),
-        end="",
+        ).encode("utf-8")
     )
 
 
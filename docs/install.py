@@ -9,18 +9,47 @@ Usage:
 
   # Local install (from cloned repo)
   python3 docs/install.py
+
+  # Ignore the download cache (~/.cache/vibemon) and fetch every file in full
+  curl -fsSL https://docs.vibemon.io/install.py | python3 - --no-cache
+
+  # Non-interactive install (CI): no prompts, defaults are used
+  curl -fsSL https://docs.vibemon.io/install.py | python3 - --yes claude
+  (or set VIBEMON_NONINTERACTIVE=1; platform: claude, kiro, openclaw or all)
 """
 
-import difflib
+import copy
+import hashlib
+import itertools
 import json
+import os
+import re
 import sys
+import threading
+from abc import ABC, abstractmethod
 from pathlib import Path
-from urllib.request import urlopen
-from urllib.error import URLError
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+# Non-interactive mode: never prompt, answer every question with its default
+NONINTERACTIVE = "--yes" in sys.argv[1:] or os.environ.get("VIBEMON_NONINTERACTIVE", "0") == "1"
+
+
+def json_loads(data):
+    """Parse JSON text or bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 def setup_tty_input():
     """Reopen stdin from /dev/tty to allow interactive input when piped."""
+    if NONINTERACTIVE:
+        return
     if not sys.stdin.isatty():
         try:
             sys.stdin = open("/dev/tty", "r")
@@ -54,25 +83,88 @@ OPENCLAW_FILES = [
     "openclaw/extensions/index.mjs",
 ]
 
+# Install targets (resolved once)
+HOME_DIR = Path.home()
+CLAUDE_HOME = HOME_DIR / ".claude"
+KIRO_HOME = HOME_DIR / ".kiro"
+OPENCLAW_HOME = HOME_DIR / ".openclaw"
+VIBEMON_HOME = HOME_DIR / ".vibemon"
+
 # Shared configuration example file
 CONFIG_EXAMPLE_FILE = "config.example.json"
 
+# Parallel downloads when prefetching files in online mode
+MAX_DOWNLOAD_WORKERS = 8
+DOWNLOAD_TIMEOUT_SECONDS = 30
+MAX_REDIRECTS = 5
+
+# Diff lines printed before an existing file is overwritten
+MAX_DIFF_LINES = 50
+DIFF_CONTEXT_LINES = 3
+
+HUNK_HEADER_PATTERN = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@")
+
+# Keep-alive connections, one set per thread (http.client is not thread-safe)
+_http_local = threading.local()
+
+# Downloaded files are cached by URL and revalidated with their ETag
+DOWNLOAD_CACHE_DIR = HOME_DIR / ".cache" / "vibemon"
+_etags = None
+_etags_lock = threading.Lock()
+
+# Directories already created during this run (shared by all installers)
+_ensured_dirs: set = set()
+
+# Set once the token prompt has run (shared by all installers)
+_token_configured = False
+
+
+# ANSI color codes, decided once: empty when stdout is not a terminal
+# or the run is non-interactive
+USE_COLOR = sys.stdout.isatty() and not NONINTERACTIVE
+COLOR_RED = "\033[91m" if USE_COLOR else ""
+COLOR_GREEN = "\033[92m" if USE_COLOR else ""
+COLOR_YELLOW = "\033[93m" if USE_COLOR else ""
+COLOR_BLUE = "\033[94m" if USE_COLOR else ""
+COLOR_CYAN = "\033[96m" if USE_COLOR else ""
+COLOR_RESET = "\033[0m" if USE_COLOR else ""
+
+COLORS = {
+    "red": COLOR_RED,
+    "green": COLOR_GREEN,
+    "yellow": COLOR_YELLOW,
+    "blue": COLOR_BLUE,
+    "cyan": COLOR_CYAN,
+}
+
 
 def colored(text: str, color: str) -> str:
     """Return colored text for terminal output."""
-    colors = {
-        "red": "\033[91m",
-        "green": "\033[92m",
-        "yellow": "\033[93m",
-        "blue": "\033[94m",
-        "cyan": "\033[96m",
-        "reset": "\033[0m",
-    }
-    return f"{colors.get(color, '')}{text}{colors['reset']}"
+    if not USE_COLOR:
+        return text
+    return f"{COLORS.get(color, '')}{text}{COLOR_RESET}"
+
+
+def red(text: str) -> str:
+    """Return text in red (diff removals)."""
+    return f"{COLOR_RED}{text}{COLOR_RESET}"
+
+
+def green(text: str) -> str:
+    """Return text in green (diff additions)."""
+    return f"{COLOR_GREEN}{text}{COLOR_RESET}"
+
+
+def cyan(text: str) -> str:
+    """Return text in cyan (diff hunk headers)."""
+    return f"{COLOR_CYAN}{text}{COLOR_RESET}"
 
 
 def ask_yes_no(question: str, default: bool = True) -> bool:
     """Ask a yes/no question and return the answer."""
+    if NONINTERACTIVE:
+        return default
+
     suffix = "[Y/n]" if default else "[y/N]"
     while True:
         answer = input(f"{question} {suffix}: ").strip().lower()
@@ -85,6 +177,13 @@ def ask_yes_no(question: str, default: bool = True) -> bool:
         print("Please answer 'y' or 'n'")
 
 
+def read_line(prompt: str) -> str:
+    """Read a line of input (empty in non-interactive mode)."""
+    if NONINTERACTIVE:
+        return ""
+    return input(prompt).strip()
+
+
 def mask_token(token: str) -> str:
     """Mask a token, showing only first 4 and last 4 characters."""
     if not token or len(token) <= 8:
@@ -93,7 +192,13 @@ def mask_token(token: str) -> str:
 
 
 def configure_token(config: dict) -> dict:
-    """Configure VibeMon API token interactively."""
+    """Configure VibeMon API token interactively (asked once per run)."""
+    global _token_configured
+    # All installers share ~/.vibemon/config.json: "All" asks only once
+    if _token_configured:
+        return config
+    _token_configured = True
+
     current_token = config.get("vibemon_token", "")
 
     print(f"\n{colored('VibeMon API Token Configuration:', 'cyan')}")
@@ -102,7 +207,7 @@ def configure_token(config: dict) -> dict:
     if current_token:
         print(f"  Current token: {colored(mask_token(current_token), 'yellow')}")
         if ask_yes_no("  Change token?", default=False):
-            new_token = input("  Enter new token: ").strip()
+            new_token = read_line("  Enter new token: ")
             if new_token:
                 config["vibemon_token"] = new_token
                 print(f"  {colored('✓', 'green')} Token updated")
@@ -112,7 +217,7 @@ def configure_token(config: dict) -> dict:
             print(f"  {colored('✓', 'green')} Token unchanged")
     else:
         print(f"  No token configured.")
-        token = input("  Enter token (or press Enter to skip): ").strip()
+        token = read_line("  Enter token (or press Enter to skip): ")
         if token:
             config["vibemon_token"] = token
             print(f"  {colored('✓', 'green')} Token saved")
@@ -122,23 +227,22 @@ def configure_token(config: dict) -> dict:
     return config
 
 
-def load_or_create_config(config_path: Path, example_content: str) -> dict:
-    """Load existing config or create from example."""
-    if config_path.exists():
-        try:
-            with open(config_path) as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            pass
+def load_or_create_config(config_path: Path, source: "FileSource") -> dict:
+    """Load existing config or create from example (fetched only when needed)."""
+    try:
+        return json_loads(config_path.read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError):
+        pass
 
-    # Parse example content
+    # Copy of the parsed example: callers modify the returned config
     try:
-        return json.loads(example_content)
+        return copy.deepcopy(source.get_json(CONFIG_EXAMPLE_FILE))
     except json.JSONDecodeError:
         return {
             "debug": False,
             "cache_path": "~/.vibemon/cache/statusline.json",
             "auto_launch": False,
+            "daemon": False,
             "http_urls": [],
             "serial_port": None,
             "vibemon_url": "https://vibemon.io",
@@ -146,10 +250,17 @@ def load_or_create_config(config_path: Path, example_content: str) -> dict:
         }
 
 
+def ensure_dir(directory: Path) -> None:
+    """Create a directory (and parents) unless this run already did."""
+    if directory not in _ensured_dirs:
+        directory.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(directory)
+
+
 def save_config(config_path: Path, config: dict) -> bool:
     """Save config to file."""
     try:
-        config_path.parent.mkdir(parents=True, exist_ok=True)
+        ensure_dir(config_path.parent)
         with open(config_path, "w") as f:
             json.dump(config, f, indent=2)
             f.write("\n")
@@ -159,55 +270,281 @@ def save_config(config_path: Path, config: dict) -> bool:
         return False
 
 
-def download_file(url: str) -> str:
-    """Download a file from URL and return its content."""
+def get_connection(scheme: str, netloc: str) -> "http.client.HTTPConnection":
+    """Get this thread's keep-alive connection to a host (created on first use)."""
+    import http.client  # deferred: local installs never download
+
+    connections = getattr(_http_local, "connections", None)
+    if connections is None:
+        connections = _http_local.connections = {}
+
+    conn = connections.get((scheme, netloc))
+    if conn is None:
+        conn_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        conn = conn_class(netloc, timeout=DOWNLOAD_TIMEOUT_SECONDS)
+        connections[(scheme, netloc)] = conn
+    return conn
+
+
+def drop_connection(scheme: str, netloc: str) -> None:
+    """Close and forget this thread's connection to a host."""
+    conn = getattr(_http_local, "connections", {}).pop((scheme, netloc), None)
+    if conn is not None:
+        conn.close()
+
+
+def get_blob_path(url: str) -> Path:
+    """Get the download cache file for a URL."""
+    return DOWNLOAD_CACHE_DIR / "blobs" / hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def load_etags() -> dict:
+    """Load the URL -> ETag map (once per run). Caller holds _etags_lock."""
+    global _etags
+    if _etags is None:
+        try:
+            _etags = json_loads((DOWNLOAD_CACHE_DIR / "etags.json").read_bytes())
+        except (OSError, ValueError):
+            _etags = {}
+        if not isinstance(_etags, dict):
+            _etags = {}
+    return _etags
+
+
+def read_cached_download(url: str):
+    """Get (etag, body) of a cached download, or None if not cached."""
+    with _etags_lock:
+        etag = load_etags().get(url)
+    if not etag:
+        return None
     try:
-        with urlopen(url, timeout=30) as response:
-            return response.read().decode("utf-8")
-    except URLError as e:
+        return etag, get_blob_path(url).read_bytes()
+    except OSError:
+        return None
+
+
+def store_cached_download(url: str, etag: str, body: bytes) -> None:
+    """Store a downloaded body and its ETag (best effort)."""
+    blob_path = get_blob_path(url)
+    try:
+        ensure_dir(blob_path.parent)
+        # Atomic, so an interrupted run never leaves a truncated blob behind an ETag
+        write_bytes_atomic(blob_path, body)
+        with _etags_lock:
+            etags = load_etags()
+            etags[url] = etag
+            etags_path = DOWNLOAD_CACHE_DIR / "etags.json"
+            tmp_path = etags_path.with_name(f"etags.json.tmp.{os.getpid()}")
+            tmp_path.write_text(json.dumps(etags, indent=2) + "\n")
+            os.replace(tmp_path, etags_path)
+    except OSError:
+        pass
+
+
+def uses_proxy(scheme: str, host: str) -> bool:
+    """Check whether urllib would route this URL through a proxy (HTTP(S)_PROXY, NO_PROXY)."""
+    import urllib.request
+
+    return scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(host)
+
+
+def fetch_with_urlopen(url: str, headers: dict) -> tuple:
+    """GET a URL with urlopen, which handles proxies and redirects itself.
+
+    Returns: (status, reason, etag, body)
+    """
+    import urllib.error
+    import urllib.request
+
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=DOWNLOAD_TIMEOUT_SECONDS) as response:
+            return response.status, response.reason, response.headers.get("ETag"), response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.reason, None, b""
+    except (urllib.error.URLError, OSError) as e:
         raise RuntimeError(f"Failed to download {url}: {e}")
 
 
+def download_file(url: str, use_cache: bool = True, redirects: int = MAX_REDIRECTS) -> str:
+    """Download a file from URL and return its content.
+
+    Reuses a keep-alive connection per host, so downloading several files
+    pays for the TCP/TLS handshake only once. With use_cache, a previously
+    downloaded file is revalidated with If-None-Match and reused on 304.
+    Behind a proxy (HTTP(S)_PROXY), the download goes through urlopen.
+    """
+    import http.client
+
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    headers = {}
+    cached = read_cached_download(url) if use_cache else None
+    if cached:
+        headers["If-None-Match"] = cached[0]
+
+    if uses_proxy(parts.scheme, parts.hostname or ""):
+        status, reason, etag, body = fetch_with_urlopen(url, headers)
+        if status == 304 and cached:
+            return cached[1].decode("utf-8")
+        if status >= 400:
+            raise RuntimeError(f"Failed to download {url}: HTTP {status} {reason}")
+        if use_cache and etag:
+            store_cached_download(url, etag, body)
+        return body.decode("utf-8")
+
+    # A reused connection may have been closed by the server; retry once
+    for attempt in range(2):
+        conn = get_connection(parts.scheme, parts.netloc)
+        try:
+            conn.request("GET", path, headers=headers)
+            response = conn.getresponse()
+            body = response.read()
+            break
+        except (http.client.HTTPException, OSError) as e:
+            drop_connection(parts.scheme, parts.netloc)
+            if attempt:
+                raise RuntimeError(f"Failed to download {url}: {e}")
+
+    if response.will_close:
+        drop_connection(parts.scheme, parts.netloc)
+
+    if response.status == 304 and cached:
+        return cached[1].decode("utf-8")
+
+    location = response.getheader("Location")
+    if response.status in (301, 302, 303, 307, 308) and location and redirects > 0:
+        return download_file(urljoin(url, location), use_cache, redirects - 1)
+
+    if response.status >= 400:
+        raise RuntimeError(f"Failed to download {url}: HTTP {response.status} {response.reason}")
+
+    etag = response.getheader("ETag")
+    if use_cache and etag:
+        store_cached_download(url, etag, body)
+
+    return body.decode("utf-8")
+
+
+# Diff line styling by first character ("+++"/"---" file headers stay plain)
+DIFF_LINE_STYLES = {"+": green, "-": red, "@": cyan}
+
+
+def trim_common_lines(old_lines: list, new_lines: list) -> tuple:
+    """Count leading/trailing lines shared by both sides that a diff can skip.
+
+    Keeps DIFF_CONTEXT_LINES of each shared block so hunks still get full
+    context. Returns (prefix, suffix) line counts.
+    """
+    limit = min(len(old_lines), len(new_lines))
+
+    prefix = 0
+    while prefix < limit and old_lines[prefix] == new_lines[prefix]:
+        prefix += 1
+
+    suffix = 0
+    while suffix < limit - prefix and old_lines[-1 - suffix] == new_lines[-1 - suffix]:
+        suffix += 1
+
+    return max(0, prefix - DIFF_CONTEXT_LINES), max(0, suffix - DIFF_CONTEXT_LINES)
+
+
+def shift_hunk_header(line: str, offset: int) -> str:
+    """Shift the line numbers of a "@@ -a,b +c,d @@" hunk header by offset."""
+    match = HUNK_HEADER_PATTERN.match(line)
+    if not match:
+        return line
+    old_start, old_len, new_start, new_len = match.groups()
+    header = (
+        f"@@ -{int(old_start) + offset}{old_len or ''}"
+        f" +{int(new_start) + offset}{new_len or ''} @@"
+    )
+    return header + line[match.end():]
+
+
 def show_diff(old_content: str, new_content: str, filename: str) -> bool:
     """Show unified diff between old and new content. Returns True if different."""
+    import difflib  # deferred: only needed when an existing file changed
+
     old_lines = old_content.splitlines(keepends=True)
     new_lines = new_content.splitlines(keepends=True)
 
-    diff = list(difflib.unified_diff(
-        old_lines, new_lines,
+    # Diff only the changed middle; shared head/tail lines cannot differ
+    prefix, suffix = trim_common_lines(old_lines, new_lines)
+    diff = difflib.unified_diff(
+        old_lines[prefix:len(old_lines) - suffix],
+        new_lines[prefix:len(new_lines) - suffix],
         fromfile=f"existing {filename}",
         tofile=f"new {filename}",
         lineterm=""
-    ))
+    )
+    if prefix:
+        diff = (shift_hunk_header(line, prefix) if line.startswith("@@") else line for line in diff)
 
-    if not diff:
+    # Only the first MAX_DIFF_LINES are shown; the rest is just counted
+    shown = list(itertools.islice(diff, MAX_DIFF_LINES))
+    if not shown:
         return False
 
-    print(f"\n  {colored('Diff:', 'yellow')}")
-    for line in diff[:50]:
+    # Build the whole block and write it at once instead of a print() per line
+    out = [f"\n  {colored('Diff:', 'yellow')}\n"]
+    for line in shown:
         line = line.rstrip("\n")
-        if line.startswith("+") and not line.startswith("+++"):
-            print(f"    {colored(line, 'green')}")
-        elif line.startswith("-") and not line.startswith("---"):
-            print(f"    {colored(line, 'red')}")
-        elif line.startswith("@@"):
-            print(f"    {colored(line, 'cyan')}")
+        style = DIFF_LINE_STYLES.get(line[:1])
+        if style is None or line[:3] in ("+++", "---"):
+            out.append(f"    {line}\n")
         else:
-            print(f"    {line}")
+            out.append(f"    {style(line)}\n")
 
-    if len(diff) > 50:
-        print(f"    {colored(f'... ({len(diff) - 50} more lines)', 'yellow')}")
+    remaining = sum(1 for _ in diff)
+    if remaining:
+        out.append(f"    {colored(f'... ({remaining} more lines)', 'yellow')}\n")
 
+    sys.stdout.write("".join(out))
     return True
 
 
+def write_bytes_atomic(dst: Path, data: bytes, executable: bool = False) -> None:
+    """Write data via a sibling temp file and os.replace, so dst is never left truncated.
+
+    Keeps the permissions of an existing dst; executable adds the x bits.
+    A symlinked dst (dotfile managers) is written through: the link target
+    is replaced and the link itself is kept.
+    """
+    dst = Path(os.path.realpath(dst))
+    tmp = dst.with_name(f"{dst.name}.tmp.{os.getpid()}")
+    try:
+        mode = dst.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        mode = None
+    try:
+        # New files get their final mode at creation (umask applies), no chmod
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o777 if executable else 0o666)
+        try:
+            if mode is not None:
+                os.fchmod(fd, mode | 0o111 if executable else mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp, dst)  # os.replace is atomic on POSIX
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+
+
 def write_file(dst: Path, content: str, description: str, executable: bool = False) -> bool:
     """Write content to a file."""
     try:
-        dst.parent.mkdir(parents=True, exist_ok=True)
-        dst.write_text(content)
-        if executable:
-            dst.chmod(dst.stat().st_mode | 0o111)
+        ensure_dir(dst.parent)
+        write_bytes_atomic(dst, content.encode("utf-8"), executable)
         print(f"  {colored('✓', 'green')} {description}")
         return True
     except Exception as e:
@@ -218,32 +555,33 @@ def write_file(dst: Path, content: str, description: str, executable: bool = Fal
 def write_file_with_diff(dst: Path, content: str, description: str, executable: bool = False) -> bool:
     """Write content to a file, showing diff if it already exists."""
     try:
-        dst.parent.mkdir(parents=True, exist_ok=True)
+        new_bytes = content.encode("utf-8")
 
         if dst.exists():
-            old_content = dst.read_text()
+            old_bytes = dst.read_bytes()
 
-            if old_content == content:
+            # Compare raw bytes: unchanged files are never decoded or diffed
+            if old_bytes == new_bytes:
                 print(f"  {colored('✓', 'green')} {description} (no changes)")
                 return True
 
+            old_content = old_bytes.decode("utf-8", errors="replace")
+
             print(f"\n  {colored('!', 'yellow')} {description} already exists")
             has_diff = show_diff(old_content, content, dst.name)
 
             if has_diff:
                 if ask_yes_no(f"  Overwrite {description}?"):
-                    dst.write_text(content)
-                    if executable:
-                        dst.chmod(dst.stat().st_mode | 0o111)
+                    write_bytes_atomic(dst, new_bytes, executable)
                     print(f"  {colored('✓', 'green')} {description} (updated)")
                     return True
                 else:
                     print(f"  {colored('!', 'yellow')} {description} (skipped)")
                     return False
         else:
-            dst.write_text(content)
-            if executable:
-                dst.chmod(dst.stat().st_mode | 0o111)
+            # No-op for directories the installer already created
+            ensure_dir(dst.parent)
+            write_bytes_atomic(dst, new_bytes, executable)
             print(f"  {colored('✓', 'green')} {description}")
             return True
 
@@ -252,16 +590,20 @@ def write_file_with_diff(dst: Path, content: str, description: str, executable:
         return False
 
 
+def get_entry_commands(entry: dict) -> set:
+    """Extract the command strings of a single hook entry."""
+    if "hooks" in entry:
+        return {hook["command"] for hook in entry.get("hooks", []) if "command" in hook}
+    if "command" in entry:
+        return {entry["command"]}
+    return set()
+
+
 def get_hook_commands(hook_entries: list) -> set:
     """Extract all command strings from hook entries."""
     commands = set()
     for entry in hook_entries:
-        if "hooks" in entry:
-            for hook in entry.get("hooks", []):
-                if "command" in hook:
-                    commands.add(hook["command"])
-        elif "command" in entry:
-            commands.add(entry["command"])
+        commands |= get_entry_commands(entry)
     return commands
 
 
@@ -278,8 +620,7 @@ def merge_hooks(existing: dict, new_hooks: dict) -> dict:
             result[event] = existing_entries.copy()
 
             for new_entry in new_entries:
-                new_cmds = get_hook_commands([new_entry])
-                if not new_cmds.intersection(existing_cmds):
+                if existing_cmds.isdisjoint(get_entry_commands(new_entry)):
                     result[event].append(new_entry)
 
     for event in existing:
@@ -289,32 +630,105 @@ def merge_hooks(existing: dict, new_hooks: dict) -> dict:
     return result
 
 
-class FileSource:
-    """Abstract file source for local or remote files."""
+class FileSource(ABC):
+    """Abstract file source for local or remote files.
 
-    def __init__(self, local_dir: Path = None):
-        self.local_dir = local_dir
-        # Check if running from local docs directory (has claude/ and kiro/ subdirs)
-        self.is_online = local_dir is None or not (local_dir / "claude").exists()
+    Contents are cached per path, so a file used by several installers
+    (e.g. config.example.json with "All") is loaded once.
+    """
+
+    is_online = False
+
+    def __init__(self):
+        self._cache = {}
+        self._json_cache = {}
+
+    def prefetch(self, paths: list) -> None:
+        """Load files ahead of get_file() (no-op unless overridden)."""
+
+    @abstractmethod
+    def load_file(self, path: str) -> str:
+        """Load file content from the underlying source (uncached)."""
 
     def get_file(self, path: str) -> str:
-        """Get file content from local or remote source."""
-        if self.is_online:
-            url = f"{DOCS_BASE_URL}/{path}"
-            return download_file(url)
-        else:
-            return (self.local_dir / path).read_text()
+        """Get file content (cached per path)."""
+        content = self._cache.get(path)
+        if content is None:
+            content = self._cache[path] = self.load_file(path)
+        return content
+
+    def get_json(self, path: str):
+        """Get a file parsed as JSON (parsed once per path; do not mutate)."""
+        if path not in self._json_cache:
+            self._json_cache[path] = json_loads(self.get_file(path))
+        return self._json_cache[path]
+
+
+class LocalFileSource(FileSource):
+    """Files read from a cloned docs directory."""
+
+    def __init__(self, local_dir: Path):
+        super().__init__()
+        self.local_dir = local_dir
+
+    def load_file(self, path: str) -> str:
+        """Read file content from the local docs directory."""
+        return (self.local_dir / path).read_text()
+
+
+class RemoteFileSource(FileSource):
+    """Files downloaded from DOCS_BASE_URL."""
+
+    is_online = True
+
+    def __init__(self, use_cache: bool = True):
+        super().__init__()
+        self.use_cache = use_cache
+
+    def prefetch(self, paths: list) -> None:
+        """Download files in parallel so later get_file() calls are served from memory.
+
+        Failed downloads are not cached; get_file() retries and reports them.
+        """
+        paths = [path for path in dict.fromkeys(paths) if path not in self._cache]
+        if not paths:
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        def fetch(path: str):
+            try:
+                return path, self.load_file(path)
+            except RuntimeError:
+                return path, None
+
+        with ThreadPoolExecutor(max_workers=min(MAX_DOWNLOAD_WORKERS, len(paths))) as executor:
+            for path, content in executor.map(fetch, paths):
+                if content is not None:
+                    self._cache[path] = content
+
+    def load_file(self, path: str) -> str:
+        """Download file content."""
+        return download_file(f"{DOCS_BASE_URL}/{path}", self.use_cache)
+
+
+def make_source(local_dir: Path = None, use_cache: bool = True) -> FileSource:
+    """Create the file source: local when run from the docs directory, else online."""
+    # Running from local docs directory (has claude/ and kiro/ subdirs)
+    if local_dir is not None and (local_dir / "claude").exists():
+        return LocalFileSource(local_dir)
+    return RemoteFileSource(use_cache)
 
 
 def install_claude(source: FileSource) -> bool:
     """Install VibeMon for Claude Code."""
     print(f"\n{colored('Installing VibeMon for Claude Code...', 'cyan')}\n")
 
-    claude_home = Path.home() / ".claude"
-    vibemon_home = Path.home() / ".vibemon"
-    claude_home.mkdir(parents=True, exist_ok=True)
-    vibemon_home.mkdir(parents=True, exist_ok=True)
-    (claude_home / "hooks").mkdir(parents=True, exist_ok=True)
+    claude_home = CLAUDE_HOME
+    vibemon_home = VIBEMON_HOME
+    # Create each target directory once (parents come along)
+    for directory in (vibemon_home, claude_home / "hooks"):
+        ensure_dir(directory)
 
     print("Copying files:")
 
@@ -329,11 +743,17 @@ def install_claude(source: FileSource) -> bool:
     # Handle settings.json
     print("\nConfiguring settings.json:")
     settings_file = claude_home / "settings.json"
-    new_settings = json.loads(source.get_file("claude/settings.json"))
+    new_settings = source.get_json("claude/settings.json")
 
-    if settings_file.exists():
+    # One read serves as both the existence check and the content
+    try:
+        settings_bytes = settings_file.read_bytes()
+    except FileNotFoundError:
+        settings_bytes = None
+
+    if settings_bytes is not None:
         try:
-            existing_settings = json.loads(settings_file.read_text())
+            existing_settings = json_loads(settings_bytes)
         except json.JSONDecodeError:
             existing_settings = {}
 
@@ -361,18 +781,17 @@ def install_claude(source: FileSource) -> bool:
             existing_settings["statusLine"] = new_settings["statusLine"]
             print(f"  {colored('✓', 'green')} statusLine added")
 
-        settings_file.write_text(json.dumps(existing_settings, indent=2) + "\n")
+        write_bytes_atomic(settings_file, (json.dumps(existing_settings, indent=2) + "\n").encode("utf-8"))
         print(f"  {colored('✓', 'green')} hooks merged into settings.json")
     else:
-        settings_file.write_text(json.dumps(new_settings, indent=2) + "\n")
+        write_bytes_atomic(settings_file, (json.dumps(new_settings, indent=2) + "\n").encode("utf-8"))
         print(f"  {colored('✓', 'green')} settings.json created")
 
     # Handle config.json -> ~/.vibemon/config.json
-    config_content = source.get_file(CONFIG_EXAMPLE_FILE)
     config_path = vibemon_home / "config.json"
 
     print("\nConfiguring VibeMon:")
-    config = load_or_create_config(config_path, config_content)
+    config = load_or_create_config(config_path, source)
 
     if not config_path.exists():
         print(f"  Creating new config at ~/.vibemon/config.json")
@@ -394,12 +813,11 @@ def install_kiro(source: FileSource) -> bool:
     """Install VibeMon for Kiro IDE."""
     print(f"\n{colored('Installing VibeMon for Kiro IDE...', 'cyan')}\n")
 
-    kiro_home = Path.home() / ".kiro"
-    vibemon_home = Path.home() / ".vibemon"
-    kiro_home.mkdir(parents=True, exist_ok=True)
-    vibemon_home.mkdir(parents=True, exist_ok=True)
-    (kiro_home / "hooks").mkdir(parents=True, exist_ok=True)
-    (kiro_home / "agents").mkdir(parents=True, exist_ok=True)
+    kiro_home = KIRO_HOME
+    vibemon_home = VIBEMON_HOME
+    # Create each target directory once (parents come along)
+    for directory in (vibemon_home, kiro_home / "hooks", kiro_home / "agents"):
+        ensure_dir(directory)
 
     print("Copying files:")
 
@@ -424,11 +842,10 @@ def install_kiro(source: FileSource) -> bool:
         write_file_with_diff(kiro_home / "hooks" / hook_file, content, f"~/.kiro/hooks/{hook_file}")
 
     # Handle config.json -> ~/.vibemon/config.json
-    config_content = source.get_file(CONFIG_EXAMPLE_FILE)
     config_path = vibemon_home / "config.json"
 
     print("\nConfiguring VibeMon:")
-    config = load_or_create_config(config_path, config_content)
+    config = load_or_create_config(config_path, source)
 
     if not config_path.exists():
         print(f"  Creating new config at ~/.vibemon/config.json")
@@ -450,9 +867,8 @@ def install_openclaw(source: FileSource) -> bool:
     """Install VibeMon plugin for OpenClaw."""
     print(f"\n{colored('Installing VibeMon Plugin for OpenClaw...', 'cyan')}\n")
 
-    openclaw_home = Path.home() / ".openclaw"
-    plugin_dir = openclaw_home / "extensions" / "vibemon-bridge"
-    plugin_dir.mkdir(parents=True, exist_ok=True)
+    plugin_dir = OPENCLAW_HOME / "extensions" / "vibemon-bridge"
+    ensure_dir(plugin_dir)
 
     print("Copying plugin files:")
 
@@ -501,7 +917,7 @@ def main():
 
     # Determine if running locally or online
     script_path = Path(__file__).parent.resolve() if "__file__" in dir() else None
-    source = FileSource(script_path)
+    source = make_source(script_path, use_cache="--no-cache" not in sys.argv[1:])
 
     mode = "online" if source.is_online else "local"
 
@@ -519,17 +935,26 @@ def main():
     print(f"  {colored('q)', 'cyan')} Quit")
 
     while True:
-        choice = input("\nYour choice [1/2/3/4/q]: ").strip().lower()
+        if NONINTERACTIVE:
+            # Platform comes from the command line, e.g. "--yes claude"
+            platform_args = [arg for arg in sys.argv[1:] if not arg.startswith("-")]
+            choice = platform_args[0].lower() if platform_args else ""
+        else:
+            choice = input("\nYour choice [1/2/3/4/q]: ").strip().lower()
         if choice in ("1", "claude"):
+            source.prefetch(CLAUDE_FILES + [CONFIG_EXAMPLE_FILE])
             install_claude(source)
             break
         elif choice in ("2", "kiro"):
+            source.prefetch(KIRO_FILES + [CONFIG_EXAMPLE_FILE])
             install_kiro(source)
             break
         elif choice in ("3", "openclaw"):
+            source.prefetch(OPENCLAW_FILES)
             install_openclaw(source)
             break
         elif choice in ("4", "all"):
+            source.prefetch(CLAUDE_FILES + KIRO_FILES + OPENCLAW_FILES + [CONFIG_EXAMPLE_FILE])
             install_claude(source)
             install_kiro(source)
             install_openclaw(source)
@@ -537,6 +962,9 @@ def main():
         elif choice in ("q", "quit", "exit"):
             print("\nInstallation cancelled.")
             sys.exit(0)
+        elif NONINTERACTIVE:
+            print("Error: non-interactive install needs a platform: claude, kiro, openclaw or all")
+            sys.exit(1)
         else:
             print("Please enter 1, 2, 3, 4, or q")
 
@@ -8,33 +8,62 @@ from __future__ import annotations
 
 import fcntl
 import glob
+import http.client
 import json
 import os
+import queue
+import socket
 import subprocess
 import sys
+import termios
+import threading
 import time
-import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from pathlib import Path
+from functools import lru_cache
 from typing import Any
-from urllib.error import URLError
-from urllib.request import Request, urlopen
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; stdlib json is the fallback
+    orjson = None
+
+# ============================================================================
+# JSON Helpers
+# ============================================================================
+
+def json_loads(data: str | bytes) -> Any:
+    """Parse JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to compact JSON text (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
 
 # ============================================================================
 # Configuration Loading
 # ============================================================================
 
+# Resolved once at import (no pathlib objects on the hook's startup path)
+CONFIG_PATH = os.path.expanduser("~/.vibemon/config.json")
+
+
 def load_config() -> None:
     """Load configuration from config.json and set as environment variables."""
-    config_file = Path.home() / ".vibemon" / "config.json"
-    if not config_file.exists():
-        return
 
+    # Single open: a missing file is just another IOError
     try:
-        with open(config_file) as f:
-            config = json.load(f)
-    except (json.JSONDecodeError, IOError):
+        with open(CONFIG_PATH, "rb") as f:
+            config = json_loads(f.read())
+    except (ValueError, IOError):
+        return
+    if not isinstance(config, dict):
         return
 
     # Map config keys to environment variables
@@ -69,10 +98,17 @@ ERR_INVALID_MODE = '{"error":"Invalid mode: %s. Valid modes: first-project, on-t
 
 VALID_LOCK_MODES = frozenset(["first-project", "on-thinking"])
 
+# Fixed-schema command bodies, serialized by hand (only values are escaped)
+SERIAL_CMD_UNLOCK = '{"command":"unlock"}'
+SERIAL_CMD_STATUS = '{"command":"status"}'
+SERIAL_CMD_LOCK_MODE = '{"command":"lock-mode"}'
+SERIAL_CMD_REBOOT = '{"command":"reboot"}'
+
 # Serial configuration
 SERIAL_DEBOUNCE_MS = 100
 SERIAL_LOCK_MAX_RETRIES = 10
 SERIAL_LOCK_RETRY_INTERVAL = 0.05
+SERIAL_LOCK_MIN_RETRY_INTERVAL = 0.002
 SERIAL_BAUD_RATE = "115200"
 
 # HTTP configuration
@@ -80,6 +116,7 @@ HTTP_TIMEOUT_SECONDS = 5
 
 # Desktop launch configuration
 DESKTOP_LAUNCH_WAIT_SECONDS = 3
+DESKTOP_PROBE_TIMEOUT_SECONDS = 0.2
 
 # Character configuration
 CHARACTER = "kiro"
@@ -90,6 +127,10 @@ class Config:
     """Immutable configuration container."""
 
     http_urls: tuple[str, ...]
+    is_localhost: tuple[bool, ...]  # per http_urls entry
+    desktop_url: str | None  # first localhost URL (Desktop App)
+    command_urls: tuple[str, ...]  # http_urls with localhost (Desktop App) first
+    remote_urls: tuple[str, ...]  # http_urls without localhost
     serial_port: str | None
     auto_launch: bool
     vibemon_url: str | None
@@ -111,8 +152,17 @@ def get_config() -> Config:
     """Get configuration from environment variables (cached)."""
     global _config
     if _config is None:
+        http_urls = parse_http_urls(os.environ.get("VIBEMON_HTTP_URLS"))
+        is_localhost = tuple(is_localhost_url(url) for url in http_urls)
+        local_urls = tuple(url for url, local in zip(http_urls, is_localhost) if local)
+        remote_urls = tuple(url for url, local in zip(http_urls, is_localhost) if not local)
         _config = Config(
-            http_urls=parse_http_urls(os.environ.get("VIBEMON_HTTP_URLS")),
+            http_urls=http_urls,
+            is_localhost=is_localhost,
+            desktop_url=local_urls[0] if local_urls else None,
+            # The local app answers fastest, remote URLs keep their order
+            command_urls=local_urls + remote_urls,
+            remote_urls=remote_urls,
             serial_port=os.environ.get("VIBEMON_SERIAL_PORT"),
             auto_launch=os.environ.get("VIBEMON_AUTO_LAUNCH", "0") == "1",
             vibemon_url=os.environ.get("VIBEMON_URL"),
@@ -131,16 +181,18 @@ def debug_log(msg: str) -> None:
         print(f"[DEBUG] {msg}", file=sys.stderr)
 
 
+@lru_cache(maxsize=8)
 def resolve_serial_port(port_pattern: str | None) -> str | None:
-    """Resolve serial port pattern with wildcard support."""
+    """Resolve serial port pattern with wildcard support (cached per process)."""
     if not port_pattern:
         return None
 
     if "*" in port_pattern:
-        matches = sorted(glob.glob(port_pattern))
-        if matches:
-            debug_log(f"Found serial ports: {matches}, using: {matches[0]}")
-            return matches[0]
+        # First match in sorted order, without building and sorting a list
+        port = min(glob.iglob(port_pattern), default=None)
+        if port:
+            debug_log(f"Found serial port matching {port_pattern}, using: {port}")
+            return port
         debug_log(f"No serial port found matching: {port_pattern}")
         return None
 
@@ -166,9 +218,13 @@ EVENT_STATE_MAP: dict[str, str] = {
 }
 
 
+# Bound once: get_state is a single dict lookup per event
+_event_state_get = EVENT_STATE_MAP.get
+
+
 def get_state(event_type: str) -> str:
     """Map event type to state."""
-    return EVENT_STATE_MAP.get(event_type, "working")
+    return _event_state_get(event_type, "working")
 
 
 def get_git_root(directory: str) -> str | None:
@@ -207,16 +263,19 @@ def get_project_name(directory: str) -> str:
 
 
 def build_payload(state: str, project: str, event: str | None = None) -> dict[str, Any]:
-    """Build payload dict for sending to monitor."""
-    payload: dict[str, Any] = {
+    """Build payload dict for sending to monitor.
+
+    Keys match the VibeMon API body exactly, so one serialization serves
+    HTTP, serial and the API.
+    """
+    return {
         "state": state,
         "project": project,
-        "character": CHARACTER,
         "tool": event or "",
         "model": "",
         "memory": 0,
+        "character": CHARACTER,
     }
-    return payload
 
 
 # ============================================================================
@@ -233,26 +292,46 @@ def _get_serial_debounce_path(port: str) -> str:
     return f"/tmp/vibe-monitor-serial-{port.replace('/', '_')}.debounce"
 
 
-def _get_serial_debounce_lock_path(port: str) -> str:
-    """Get debounce lock file path for serial port."""
-    return f"/tmp/vibe-monitor-serial-{port.replace('/', '_')}.dlock"
-
-
 def _acquire_lock(lock_fd: int, max_retries: int = SERIAL_LOCK_MAX_RETRIES) -> bool:
-    """Try to acquire file lock with retries."""
-    for attempt in range(max_retries):
+    """Try to acquire file lock within max_retries * SERIAL_LOCK_RETRY_INTERVAL.
+
+    Polls with a short, doubling back-off (capped at the retry interval), so
+    a lock released a few ms later is picked up in a few ms. A blocking
+    flock with SIGALRM is not an option: sends run on worker threads.
+    """
+    deadline = time.monotonic() + max_retries * SERIAL_LOCK_RETRY_INTERVAL
+    delay = SERIAL_LOCK_MIN_RETRY_INTERVAL
+    while True:
         try:
             fcntl.flock(lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
             return True
         except BlockingIOError:
-            if attempt < max_retries - 1:
-                time.sleep(SERIAL_LOCK_RETRY_INTERVAL)
-    return False
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, SERIAL_LOCK_RETRY_INTERVAL)
+
+
+def _set_baud_rate(fd: int) -> None:
+    """Set the serial line speed in-process (no stty fork/exec)."""
+    try:
+        attrs = termios.tcgetattr(fd)
+        attrs[4] = attrs[5] = getattr(termios, f"B{SERIAL_BAUD_RATE}")
+        termios.tcsetattr(fd, termios.TCSANOW, attrs)
+    except termios.error as e:
+        debug_log(f"Serial configure error: {e}")
 
 
 def send_serial_raw(port: str, data: str) -> bool:
     """Send data via serial port with file locking (internal use)."""
-    if not os.path.exists(port):
+    # Opening the port doubles as the existence check
+    try:
+        serial_fd = os.open(port, os.O_WRONLY | os.O_NOCTTY)
+    except FileNotFoundError:
+        return False
+    except OSError as e:
+        debug_log(f"Serial open error: {e}")
         return False
 
     lock_path = _get_serial_lock_path(port)
@@ -266,18 +345,9 @@ def send_serial_raw(port: str, data: str) -> bool:
             return False
 
         try:
-            # Configure serial port
-            flag = "-f" if sys.platform == "darwin" else "-F"
-            subprocess.run(
-                ["stty", flag, port, SERIAL_BAUD_RATE],
-                check=False,
-                capture_output=True,
-            )
-
-            # Write data
-            with open(port, "w") as f:
-                f.write(data + "\n")
-                f.flush()
+            # Configure serial port and write data
+            _set_baud_rate(serial_fd)
+            os.write(serial_fd, (data + "\n").encode("utf-8"))
 
             time.sleep(SERIAL_LOCK_RETRY_INTERVAL)
             return True
@@ -288,6 +358,7 @@ def send_serial_raw(port: str, data: str) -> bool:
         debug_log(f"Serial send error: {e}")
         return False
     finally:
+        os.close(serial_fd)
         if lock_fd is not None:
             try:
                 os.close(lock_fd)
@@ -295,125 +366,211 @@ def send_serial_raw(port: str, data: str) -> bool:
                 pass
 
 
+def _read_debounce_state(debounce_path: str) -> dict[str, Any] | None:
+    """Read the pending serial update from the debounce file."""
+    try:
+        with open(debounce_path, "rb") as f:
+            state = json_loads(f.read())
+    except (IOError, OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _write_debounce_state(debounce_path: str, state: dict[str, Any]) -> None:
+    """Atomically replace the debounce file (write temp file, then rename)."""
+    tmp_path = f"{debounce_path}.{state['id']}"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json_dumps(state))
+        os.replace(tmp_path, debounce_path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _flush_serial(port: str, my_id: str) -> None:
+    """Send our update if it is still the latest after the debounce window."""
+    state = _read_debounce_state(_get_serial_debounce_path(port))
+    if not state or state.get("id") != my_id:
+        debug_log("Serial debounce: skipped (newer update exists)")
+        return  # The newer writer will send
+
+    debug_log("Serial debounce: sending (we have latest)")
+    send_serial_raw(port, state.get("data", ""))
+
+
 def send_serial(port: str, data: str) -> bool:
     """Send data via serial port with debouncing.
 
-    Uses a debounce file to coalesce rapid updates. Only the last update
-    within the debounce window is actually sent to the serial port.
+    Uses a debounce file to coalesce rapid updates without blocking the
+    caller. Each update atomically replaces the debounce file and schedules
+    a check after SERIAL_DEBOUNCE_MS; only the writer that is still the
+    latest at that point actually sends to the serial port.
     """
     if not os.path.exists(port):
         return False
 
     debounce_path = _get_serial_debounce_path(port)
-    lock_path = _get_serial_debounce_lock_path(port)
-    my_id = str(uuid.uuid4())
+    # Unique per host: pid plus a monotonic timestamp (no urandom read)
+    my_id = f"{os.getpid()}-{time.monotonic_ns()}"
 
-    lock_fd = None
     try:
-        # Write our payload to the debounce file (with lock)
-        lock_fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
-        fcntl.flock(lock_fd, fcntl.LOCK_EX)
-        try:
-            with open(debounce_path, "w") as f:
-                json.dump({"id": my_id, "data": data, "time": time.time()}, f)
-        finally:
-            fcntl.flock(lock_fd, fcntl.LOCK_UN)
-            os.close(lock_fd)
-            lock_fd = None
+        _write_debounce_state(debounce_path, {"id": my_id, "data": data, "time": time.time()})
+    except (IOError, OSError) as e:
+        debug_log(f"Serial debounce error: {e}, falling back to direct send")
+        return send_serial_raw(port, data)
 
-        # Wait for debounce period
-        time.sleep(SERIAL_DEBOUNCE_MS / 1000.0)
+    # Non-daemon timer: the process waits for the flush before exiting
+    threading.Timer(SERIAL_DEBOUNCE_MS / 1000.0, _flush_serial, args=(port, my_id)).start()
+    return True
 
-        # Check if we're still the latest (with lock)
-        lock_fd = os.open(lock_path, os.O_CREAT | os.O_RDWR)
-        fcntl.flock(lock_fd, fcntl.LOCK_EX)
-        try:
-            with open(debounce_path) as f:
-                state = json.load(f)
 
-            if state["id"] != my_id:
-                debug_log("Serial debounce: skipped (newer update exists)")
-                return True  # Another process will send
+# Idle keep-alive connections keyed by (scheme, host:port)
+_http_pool: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+_http_pool_lock = threading.Lock()
 
-            debug_log("Serial debounce: sending (we have latest)")
-            return send_serial_raw(port, state["data"])
-        finally:
-            fcntl.flock(lock_fd, fcntl.LOCK_UN)
-            os.close(lock_fd)
-            lock_fd = None
 
-    except (IOError, OSError, json.JSONDecodeError) as e:
-        debug_log(f"Serial debounce error: {e}, falling back to direct send")
-        return send_serial_raw(port, data)
-    finally:
-        if lock_fd is not None:
-            try:
-                os.close(lock_fd)
-            except OSError:
-                pass
+@lru_cache(maxsize=16)
+def _uses_proxy(scheme: str, host: str) -> bool:
+    """Check whether urllib would route this URL through a proxy (HTTP(S)_PROXY, NO_PROXY)."""
+    import urllib.request
+
+    return scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(host)
+
+
+def _urlopen_request(
+    method: str, full_url: str, body: bytes | None, headers: dict[str, str] | None
+) -> tuple[int, bytes]:
+    """Send HTTP request with urlopen (proxy support; no connection reuse)."""
+    import urllib.error
+    import urllib.request
+
+    request = urllib.request.Request(full_url, data=body, headers=headers or {}, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=HTTP_TIMEOUT_SECONDS) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def _http_request(
+    method: str, full_url: str, body: bytes | None = None, headers: dict[str, str] | None = None
+) -> tuple[int, bytes]:
+    """Send HTTP request over a pooled keep-alive connection.
+
+    URLs that the environment routes through a proxy go through urlopen.
+
+    Returns: (status, response_body)
+    Raises: OSError or http.client.HTTPException on failure
+    """
+    parts = urlsplit(full_url)
+    if _uses_proxy(parts.scheme, parts.hostname or ""):
+        return _urlopen_request(method, full_url, body, headers)
+    key = (parts.scheme, parts.netloc)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    with _http_pool_lock:
+        idle = _http_pool.get(key)
+        conn = idle.pop() if idle else None
+    reused = conn is not None
+
+    while True:
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(parts.netloc, timeout=HTTP_TIMEOUT_SECONDS)
+        try:
+            conn.request(method, path, body=body, headers=headers or {})
+            response = conn.getresponse()
+            result = response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            if not reused:
+                raise
+            # Stale keep-alive connection; retry once on a fresh one
+            conn = None
+            reused = False
+            continue
+        break
+
+    if response.will_close:
+        conn.close()
+    else:
+        with _http_pool_lock:
+            _http_pool.setdefault(key, []).append(conn)
+    return result
 
 
-def send_http_post(url: str, endpoint: str, data: str | None = None) -> tuple[bool, str | None]:
-    """Send HTTP POST request."""
+def send_http_post(url: str, endpoint: str, data: str | bytes | None = None) -> tuple[bool, str | None]:
+    """Send HTTP POST request (data may be pre-encoded bytes)."""
     try:
-        full_url = f"{url}{endpoint}"
         if data:
-            req = Request(
-                full_url,
-                data=data.encode("utf-8"),
-                headers={"Content-Type": "application/json"},
-                method="POST",
+            status, body = _http_request(
+                "POST",
+                f"{url}{endpoint}",
+                data.encode("utf-8") if isinstance(data, str) else data,
+                {"Content-Type": "application/json"},
             )
         else:
-            req = Request(full_url, method="POST")
-
-        with urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as response:
-            return True, response.read().decode("utf-8")
-    except (URLError, TimeoutError, OSError):
+            status, body = _http_request("POST", f"{url}{endpoint}")
+        if status >= 400:
+            return False, None
+        return True, body.decode("utf-8")
+    except (OSError, http.client.HTTPException, ValueError):
         return False, None
 
 
 def send_http_get(url: str, endpoint: str) -> tuple[bool, str | None]:
     """Send HTTP GET request."""
     try:
-        with urlopen(f"{url}{endpoint}", timeout=HTTP_TIMEOUT_SECONDS) as response:
-            return True, response.read().decode("utf-8")
-    except (URLError, TimeoutError, OSError):
+        status, body = _http_request("GET", f"{url}{endpoint}")
+        if status >= 400:
+            return False, None
+        return True, body.decode("utf-8")
+    except (OSError, http.client.HTTPException, ValueError):
         return False, None
 
 
-def send_vibemon_api(url: str, token: str, payload: dict[str, Any]) -> bool:
+def send_vibemon_api(
+    url: str, token: str, payload: dict[str, Any], api_payload: bytes | None = None
+) -> bool:
     """Send status to VibeMon API with Bearer token authentication.
 
     API: POST /status
     Headers: Authorization: Bearer <token>, Content-Type: application/json
     Body: { state, project, tool, model, memory, character }
+
+    api_payload: pre-encoded body, if the caller already has one
     """
     try:
         api_url = f"{url.rstrip('/')}/status"
-        api_payload = json.dumps({
-            "state": payload.get("state", ""),
-            "project": payload.get("project", ""),
-            "tool": payload.get("tool", ""),
-            "model": payload.get("model", ""),
-            "memory": payload.get("memory", 0),
-            "character": payload.get("character", CHARACTER),
-        })
-
-        req = Request(
+        if api_payload is None:
+            api_payload = json_dumps({
+                "state": payload.get("state", ""),
+                "project": payload.get("project", ""),
+                "tool": payload.get("tool", ""),
+                "model": payload.get("model", ""),
+                "memory": payload.get("memory", 0),
+                "character": payload.get("character", CHARACTER),
+            }).encode("utf-8")
+
+        status, _ = _http_request(
+            "POST",
             api_url,
-            data=api_payload.encode("utf-8"),
-            headers={
+            api_payload,
+            {
                 "Content-Type": "application/json",
                 "Authorization": f"Bearer {token}",
             },
-            method="POST",
         )
-
-        with urlopen(req, timeout=HTTP_TIMEOUT_SECONDS) as response:
-            debug_log(f"VibeMon API response: {response.status}")
-            return response.status == 200
-    except (URLError, TimeoutError, OSError) as e:
+        if DEBUG:
+            debug_log(f"VibeMon API response: {status}")
+        return status == 200
+    except (OSError, http.client.HTTPException, ValueError) as e:
         debug_log(f"VibeMon API error: {e}")
         return False
 
@@ -441,30 +598,69 @@ def try_http_targets(
     data: str | None = None,
     method: str = "POST",
     include_localhost: bool = True,
+    config: Config | None = None,
 ) -> tuple[bool, str | None]:
-    """Try HTTP targets in order.
+    """Try HTTP targets in order, localhost (Desktop App) first.
+
+    Commands (POST) go to one target at a time and stop at the first
+    success, so only one device is locked/changed. Queries (GET) have no
+    side effects and are sent to all targets at once; the answer still
+    comes from the earliest target in that order that succeeds.
 
     Returns: (success, result_text)
     """
-    config = get_config()
+    if config is None:
+        config = get_config()
+
+    urls = config.command_urls if include_localhost else config.remote_urls
+    if method == "POST" or len(urls) <= 1:
+        for url in urls:
+            debug_log(f"Trying HTTP: {url}")
+            success, result = _send_http_request(url, endpoint, data, method)
+            if success:
+                return True, result
+        return False, None
 
-    for url in config.http_urls:
-        if not include_localhost and is_localhost_url(url):
-            continue
+    results: queue.Queue = queue.Queue()
+
+    def attempt(index: int, url: str) -> None:
+        outcome: tuple[bool, str | None] = (False, None)
+        try:
+            outcome = _send_http_request(url, endpoint, data, method)
+        finally:
+            # Always report, so the collector below never waits forever
+            results.put((index, outcome))
+
+    # Daemon threads: a slow URL must not hold up exit once a result is in
+    for index, url in enumerate(urls):
         debug_log(f"Trying HTTP: {url}")
-        success, result = _send_http_request(url, endpoint, data, method)
-        if success:
-            return True, result
+        threading.Thread(target=attempt, args=(index, url), daemon=True).start()
+
+    # Deterministic answer: the first success in URL order
+    done: dict[int, tuple[bool, str | None]] = {}
+    next_index = 0
+    while next_index < len(urls):
+        index, outcome = results.get()
+        done[index] = outcome
+        while next_index in done:
+            success, result = done[next_index]
+            if success:
+                return True, result
+            next_index += 1
 
     return False, None
 
 
-def try_serial_target(command_data: str) -> tuple[bool, str | None]:
+def try_serial_target(command_data: str, config: Config | None = None) -> tuple[bool, str | None]:
     """Try Serial target.
 
+    Commands are written synchronously, not debounced, so the result
+    reflects the actual write.
+
     Returns: (success, resolved_port)
     """
-    config = get_config()
+    if config is None:
+        config = get_config()
 
     if not config.serial_port:
         return False, None
@@ -474,7 +670,7 @@ def try_serial_target(command_data: str) -> tuple[bool, str | None]:
         return False, None
 
     debug_log(f"Trying Serial: {resolved_port}")
-    if send_serial(resolved_port, command_data):
+    if send_serial_raw(resolved_port, command_data):
         return True, resolved_port
 
     return False, None
@@ -490,13 +686,15 @@ def try_all_targets(
 
     Returns: (success, result_text or None)
     """
+    config = get_config()
+
     # Try HTTP targets first
-    success, result = try_http_targets(endpoint, http_data, "POST", include_localhost)
+    success, result = try_http_targets(endpoint, http_data, "POST", include_localhost, config)
     if success:
         return True, result
 
     # Try Serial
-    success, _ = try_serial_target(serial_command)
+    success, _ = try_serial_target(serial_command, config)
     if success:
         return True, None  # Serial doesn't return response
 
@@ -516,8 +714,9 @@ def send_lock(project: str) -> bool:
     """Lock the monitor to a specific project."""
     debug_log(f"Locking project: {project}")
 
-    http_data = json.dumps({"project": project})
-    serial_data = json.dumps({"command": "lock", "project": project})
+    project_json = json_dumps(project)
+    http_data = f'{{"project":{project_json}}}'
+    serial_data = f'{{"command":"lock","project":{project_json}}}'
 
     success, result = try_all_targets("/lock", http_data, serial_data)
 
@@ -534,8 +733,7 @@ def send_unlock() -> bool:
     """Unlock the monitor."""
     debug_log("Unlocking")
 
-    serial_data = json.dumps({"command": "unlock"})
-    success, result = try_all_targets("/unlock", None, serial_data)
+    success, result = try_all_targets("/unlock", None, SERIAL_CMD_UNLOCK)
 
     if success:
         _print_result(result, '{"success":true,"locked":null}')
@@ -555,8 +753,7 @@ def get_status() -> bool:
         return True
 
     # Try Serial (can't read response)
-    serial_data = json.dumps({"command": "status"})
-    success, _ = try_serial_target(serial_data)
+    success, _ = try_serial_target(SERIAL_CMD_STATUS)
     if success:
         print('{"info":"Status command sent via serial. Check device output."}')
         return True
@@ -575,8 +772,7 @@ def get_lock_mode() -> bool:
         return True
 
     # Try Serial (can't read response)
-    serial_data = json.dumps({"command": "lock-mode"})
-    success, _ = try_serial_target(serial_data)
+    success, _ = try_serial_target(SERIAL_CMD_LOCK_MODE)
     if success:
         print('{"info":"Lock-mode command sent via serial. Check device output."}')
         return True
@@ -594,8 +790,9 @@ def set_lock_mode(mode: str) -> bool:
 
     debug_log(f"Setting lock mode: {mode}")
 
-    http_data = json.dumps({"mode": mode})
-    serial_data = json.dumps({"command": "lock-mode", "mode": mode})
+    # mode is one of VALID_LOCK_MODES: nothing to escape
+    http_data = f'{{"mode":"{mode}"}}'
+    serial_data = f'{{"command":"lock-mode","mode":"{mode}"}}'
 
     success, result = try_all_targets("/lock-mode", http_data, serial_data)
 
@@ -612,10 +809,8 @@ def send_reboot() -> bool:
     """Reboot the ESP32 device."""
     debug_log("Rebooting ESP32")
 
-    serial_data = json.dumps({"command": "reboot"})
-
     # ESP32 only - don't include localhost (Desktop)
-    success, result = try_all_targets("/reboot", None, serial_data, include_localhost=False)
+    success, result = try_all_targets("/reboot", None, SERIAL_CMD_REBOOT, include_localhost=False)
 
     if success:
         _print_result(result, '{"success":true,"rebooting":true}')
@@ -631,9 +826,14 @@ def send_reboot() -> bool:
 # ============================================================================
 
 def is_monitor_running(url: str) -> bool:
-    """Check if monitor is running."""
-    success, _ = send_http_get(url, "/health")
-    return success
+    """Check if monitor is running (a TCP connect, no HTTP round trip)."""
+    parts = urlsplit(url)
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        with socket.create_connection((parts.hostname, port), timeout=DESKTOP_PROBE_TIMEOUT_SECONDS):
+            return True
+    except (OSError, ValueError):
+        return False
 
 
 def show_monitor_window(url: str) -> None:
@@ -674,28 +874,67 @@ def launch_desktop() -> None:
         debug_log(f"Failed to launch Desktop App: {e}")
 
 
-def get_desktop_url(http_urls: tuple[str, ...]) -> str | None:
-    """Get first localhost URL (Desktop App) from HTTP URLs."""
-    for url in http_urls:
-        if is_localhost_url(url):
-            return url
-    return None
+def ensure_desktop(url: str) -> None:
+    """Launch Desktop App if it is not running, then show its window."""
+    if not is_monitor_running(url):
+        debug_log("Desktop App not running, launching...")
+        launch_desktop()
+    show_monitor_window(url)
+
+
+def ensure_desktop_background(url: str) -> None:
+    """Run ensure_desktop in a detached child process.
+
+    Uses fork on POSIX systems so the health check and launch wait don't
+    block the hook, falls back to synchronous launch on Windows or if fork
+    fails.
+    """
+    if not hasattr(os, "fork"):
+        ensure_desktop(url)
+        return
+
+    try:
+        pid = os.fork()
+        if pid == 0:
+            # Child process - detach, launch and exit
+            try:
+                os.setsid()
+                # Release the hook's stdio so its reader sees EOF now
+                devnull = os.open(os.devnull, os.O_RDWR)
+                for fd in (0, 1, 2):
+                    os.dup2(devnull, fd)
+                ensure_desktop(url)
+            except Exception:
+                pass
+            os._exit(0)
+        # Parent process continues immediately
+    except OSError:
+        # Fork failed - launch synchronously
+        ensure_desktop(url)
+
+
+def _run_send_task(name: str, task: Any) -> None:
+    """Run a send task on the calling thread and log its outcome."""
+    try:
+        success = task()
+        if DEBUG:
+            debug_log(f"Sent to {name}" if success else f"{name} failed")
+    except Exception as e:
+        debug_log(f"{name} failed with error: {e}")
 
 
 def send_to_all(payload: dict[str, Any], is_start: bool = False) -> None:
     """Send payload to all configured targets concurrently."""
     config = get_config()
 
-    # Launch Desktop App if not running (on start) - must be sequential
-    desktop_url = get_desktop_url(config.http_urls)
+    # Launch Desktop App if not running (on start) - off the critical path
+    desktop_url = config.desktop_url
     if desktop_url and is_start and config.auto_launch:
-        if not is_monitor_running(desktop_url):
-            debug_log("Desktop App not running, launching...")
-            launch_desktop()
-        show_monitor_window(desktop_url)
+        ensure_desktop_background(desktop_url)
 
-    # Convert to JSON string once for HTTP/Serial targets
-    payload_str = json.dumps(payload)
+    # Serialize and encode once: str for the serial debounce file, bytes for HTTP
+    payload_str = json_dumps(payload)
+    payload_bytes = payload_str.encode("utf-8")
 
     # Resolve serial port once
     resolved_port: str | None = None
@@ -707,11 +946,11 @@ def send_to_all(payload: dict[str, Any], is_start: bool = False) -> None:
     # Build list of tasks to run in parallel
     tasks: list[tuple[str, Any]] = []
 
-    for url in config.http_urls:
+    for url, is_local in zip(config.http_urls, config.is_localhost):
         # Capture url in closure
         u = url
-        label = "Desktop App" if is_localhost_url(url) else f"HTTP ({url})"
-        tasks.append((label, lambda u=u: send_http_post(u, "/status", payload_str)[0]))
+        label = "Desktop App" if is_local else f"HTTP ({url})"
+        tasks.append((label, lambda u=u: send_http_post(u, "/status", payload_bytes)[0]))
 
     if resolved_port:
         # Capture resolved_port in closure
@@ -722,20 +961,30 @@ def send_to_all(payload: dict[str, Any], is_start: bool = False) -> None:
     if config.vibemon_url and config.vibemon_token and payload.get("project"):
         tasks.append((
             "VibeMon API",
-            lambda: send_vibemon_api(config.vibemon_url, config.vibemon_token, payload)
+            # build_payload() already has the API shape: reuse payload_bytes
+            lambda: send_vibemon_api(
+                config.vibemon_url, config.vibemon_token, payload, payload_bytes
+            )
         ))
 
     if not tasks:
         return
 
-    # Execute all tasks concurrently
-    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
-        future_to_name = {executor.submit(task): name for name, task in tasks}
+    # Run the last task on this thread; only the others need worker threads
+    *background, (local_name, local_task) = tasks
+    if not background:
+        _run_send_task(local_name, local_task)
+        return
+
+    with ThreadPoolExecutor(max_workers=len(background)) as executor:
+        future_to_name = {executor.submit(task): name for name, task in background}
+        _run_send_task(local_name, local_task)
         for future in as_completed(future_to_name):
             name = future_to_name[future]
             try:
                 success = future.result()
-                debug_log(f"Sent to {name}" if success else f"{name} failed")
+                if DEBUG:
+                    debug_log(f"Sent to {name}" if success else f"{name} failed")
             except Exception as e:
                 debug_log(f"{name} failed with error: {e}")
 
@@ -789,11 +1038,14 @@ def main() -> None:
     # Get project name from git root or current directory
     project_name = get_project_name(os.getcwd())
 
-    debug_log(f"Event: {event_type}, State: {state}, Project: {project_name}")
+    if DEBUG:
+        debug_log(f"Event: {event_type}, State: {state}, Project: {project_name}")
 
     # Build payload (include event as tool)
     payload = build_payload(state, project_name, event_type)
-    debug_log(f"Payload: {json.dumps(payload)}")
+    if DEBUG:
+        # Serializing only to log it is skipped unless debugging
+        debug_log(f"Payload: {json_dumps(payload)}")
 
     # Check if start event (promptSubmit is typically the first event)
     is_start = event_type == "promptSubmit"